@@ -1,46 +1,89 @@
+import functools
+import importlib
 import logging
 import os
 import signal
+import socket
 import sys
-from PyQt5.QtCore import QTimer
+import time
+from PyQt5.QtCore import (QObject, QRunnable, QSocketNotifier, QThread,
+                          QThreadPool, QTimer, pyqtSignal)
 from PyQt5.QtGui import QIcon
-from PyQt5.QtWidgets import (QApplication, QHBoxLayout, QMainWindow,
+from PyQt5.QtWidgets import (QApplication, QButtonGroup, QHBoxLayout, QMainWindow,
                              QPushButton, QStackedWidget, QVBoxLayout, QWidget)
 
 from src.config.config import Config
-from src.core.browser import BrowserThread
-from src.core.pages.home import HomePage
-from src.core.pages.tools import ToolsPage
-from src.core.pages.browser_environment_page import BrowserEnvironmentPage
-from src.core.pages.user_management_page import UserManagementPage
-from src.core.pages.simple_backend_config import BackendConfigPage
-from src.core.pages.cover_center_page import CoverCenterPage
-from src.core.pages.data_center_page import DataCenterPage
 from src.core.alert import TipWindow
 from src.logger.logger import Logger
 from src.core.ui.qt_font import (
-    get_emoji_font_family,
     get_emoji_font_family_css,
     get_ui_text_font_family_css,
     ui_font,
 )
 
+# 用户目录相关路径（只解析一次）
+_HOME_DIR = os.path.expanduser("~")
+_PLAYWRIGHT_BROWSERS_PATH = os.path.join(_HOME_DIR, ".xhs_system", "ms-playwright")
+
 # 设置日志文件路径
-log_path = os.path.expanduser('~/Desktop/xhsai_error.log')
+log_path = os.path.join(_HOME_DIR, "Desktop", "xhsai_error.log")
 logging.basicConfig(filename=log_path, level=logging.DEBUG, encoding="utf-8")
 
+# 侧边栏按钮（图标, 提示），索引即页面索引
+SIDEBAR_SPEC = (
+    ("🏠", "主页"),
+    ("👥", "用户管理"),
+    ("🌐", "浏览器环境"),
+    ("⚙️", "后台配置"),
+    ("🖼️", "封面中心"),
+    ("📊", "数据中心"),
+    ("🧰", "工具箱"),
+)
+
+# 定时任务派发给浏览器线程时保留的字段
+SCHEDULED_TASK_KEYS = (
+    "task_id",
+    "user_id",
+    "title",
+    "content",
+    "images",
+    # 热点任务相关字段（用于到点重新生成内容/图片）
+    "task_type",
+    "interval_hours",
+    "hotspot_source",
+    "hotspot_rank",
+    "use_hotspot_context",
+    "cover_template_id",
+    "page_count",
+    "platform",
+    "engine",
+)
+
+_ENV_LOADED = False
+
+
 def load_env_file():
-    """加载项目根目录的 .env（不覆盖已有环境变量）。"""
+    """加载项目根目录的 .env（不覆盖已有环境变量，进程内只加载一次）。"""
+    global _ENV_LOADED
+    if _ENV_LOADED:
+        return
+
+    project_root = os.path.dirname(os.path.abspath(__file__))
+    env_path = os.path.join(project_root, ".env")
+    try:
+        os.stat(env_path)
+    except OSError:
+        # 没有 .env 时连 dotenv 都不必导入
+        return
+
     try:
         from dotenv import load_dotenv
     except Exception:
         return
 
     try:
-        project_root = os.path.dirname(os.path.abspath(__file__))
-        env_path = os.path.join(project_root, ".env")
-        if os.path.exists(env_path):
-            load_dotenv(env_path, override=False)
+        load_dotenv(env_path, override=False)
+        _ENV_LOADED = True
     except Exception:
         pass
 
@@ -48,14 +91,68 @@ def load_env_file():
 def init_playwright_env():
     """统一 Playwright 浏览器缓存目录，提升 Windows 稳定性。"""
     try:
-        browsers_path = os.path.join(os.path.expanduser("~"), ".xhs_system", "ms-playwright")
-        os.environ.setdefault("PLAYWRIGHT_BROWSERS_PATH", browsers_path)
+        os.environ.setdefault("PLAYWRIGHT_BROWSERS_PATH", _PLAYWRIGHT_BROWSERS_PATH)
         if sys.platform == "win32":
             os.environ.setdefault("PLAYWRIGHT_DOWNLOAD_HOST", "https://npmmirror.com/mirrors/playwright")
-        os.makedirs(browsers_path, exist_ok=True)
+        os.makedirs(_PLAYWRIGHT_BROWSERS_PATH, exist_ok=True)
     except Exception:
         pass
 
+_APP_ICON = None
+
+
+def get_app_icon():
+    """返回应用图标（进程内只加载一次），图标文件不存在时返回 None。"""
+    global _APP_ICON
+    if _APP_ICON is None:
+        icon_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "build", "icon.png")
+        if not os.path.exists(icon_path):
+            return None
+        _APP_ICON = QIcon(icon_path)
+    return _APP_ICON
+
+
+_MAIN_STYLESHEET_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "src", "core", "ui", "main_window.qss"
+)
+
+
+@functools.lru_cache(maxsize=1)
+def load_main_stylesheet():
+    """读取主窗口样式表并填入字体（需在 QApplication 创建后调用，进程内只读取一次）。"""
+    with open(_MAIN_STYLESHEET_PATH, "r", encoding="utf-8") as f:
+        template = f.read()
+    return (
+        template
+        .replace("__UI_FONT__", get_ui_text_font_family_css())
+        .replace("__EMOJI_FONT__", get_emoji_font_family_css())
+    )
+
+
+def install_signal_wakeup(app):
+    """
+    收到信号时唤醒 Qt 事件循环，让 Python 信号处理器得以执行（替代定时轮询）。
+    返回需要保持引用的 (读端, 写端, notifier)。
+    """
+    rsock, wsock = socket.socketpair()
+    rsock.setblocking(False)
+    wsock.setblocking(False)
+    signal.set_wakeup_fd(wsock.fileno())
+
+    notifier = QSocketNotifier(rsock.fileno(), QSocketNotifier.Read, app)
+
+    def drain_wakeup_fd():
+        # 回到 Python 解释器即会运行挂起的信号处理器，这里只需清空唤醒字节
+        try:
+            while rsock.recv(64):
+                pass
+        except OSError:
+            pass
+
+    notifier.activated.connect(drain_wakeup_fd)
+    return rsock, wsock, notifier
+
+
 def init_database_on_startup():
     """应用启动时初始化数据库"""
     try:
@@ -67,26 +164,27 @@ def init_database_on_startup():
         # 确保数据库已准备就绪（包含自动修复功能）
         success = database_manager.ensure_database_ready()
         
+        # 汇总结果后一次性输出
         if success:
-            print("✅ 数据库已准备就绪")
-            
-            # 显示数据库信息
             db_info = database_manager.get_database_info()
-            print(f"📁 数据库路径: {db_info['db_path']}")
-            print(f"📊 数据库大小: {db_info['size']} 字节")
-            print(f"📋 数据表数量: {len(db_info['tables'])}")
-            
-            # 显示健康状态
             health = db_info['health']
+            lines = [
+                "✅ 数据库已准备就绪",
+                f"📁 数据库路径: {db_info['db_path']}",
+                f"📊 数据库大小: {db_info['size']} 字节",
+                f"📋 数据表数量: {len(db_info['tables'])}",
+            ]
             if health['healthy']:
-                print("💚 数据库健康状态: 良好")
+                lines.append("💚 数据库健康状态: 良好")
             else:
-                print("🟡 数据库健康状态: 存在问题")
-                for issue in health['issues']:
-                    print(f"  ⚠️ {issue}")
+                lines.append("🟡 数据库健康状态: 存在问题")
+                lines.extend(f"  ⚠️ {issue}" for issue in health['issues'])
         else:
-            print("❌ 数据库初始化失败")
-            print("💡 请尝试手动运行数据库修复或联系技术支持")
+            lines = [
+                "❌ 数据库初始化失败",
+                "💡 请尝试手动运行数据库修复或联系技术支持",
+            ]
+        print("\n".join(lines))
             
         return success
     except Exception as e:
@@ -95,21 +193,167 @@ def init_database_on_startup():
         traceback.print_exc()
         return False
 
+
+class BackgroundTaskSignals(QObject):
+    finished = pyqtSignal(object)  # 任务返回值（出错时为 None）
+
+
+class BackgroundTask(QRunnable):
+    """在线程池中执行一个短任务，返回值通过 signals.finished 回到主线程"""
+
+    def __init__(self, fn):
+        super().__init__()
+        self.fn = fn
+        self.signals = BackgroundTaskSignals()
+
+    def run(self):
+        try:
+            result = self.fn()
+        except Exception:
+            logging.exception("后台任务执行出错：")
+            result = None
+        self.signals.finished.emit(result)
+
+
+class ChromeSetupThread(QThread):
+    """后台检查/下载 Playwright Chromium，日志通过信号回到主线程输出"""
+
+    log = pyqtSignal(str, str)  # (级别: info/success/warning/error, 消息)
+
+    DOWNLOAD_TIMEOUT = 1200  # 20分钟超时（部分网络较慢）
+
+    def run(self):
+        """使用Playwright下载Chrome浏览器"""
+        try:
+            self.log.emit("info", "🔍 检查Chrome浏览器...")
+
+            # 尝试导入playwright
+            try:
+                from playwright.sync_api import sync_playwright
+                self.log.emit("info", "✅ Playwright已安装")
+            except ImportError:
+                self.log.emit("error", "❌ Playwright未安装，请运行: pip install playwright")
+                self.log.emit("info", "💡 浏览器功能将不可用，但不影响其他功能的正常使用")
+                return
+
+            # 检查Chrome是否已安装（只检查可执行文件，不启动整个浏览器）
+            with sync_playwright() as p:
+                try:
+                    executable_path = p.chromium.executable_path
+                except Exception:
+                    executable_path = ""
+                if executable_path and os.path.exists(executable_path):
+                    self.log.emit("success", "✅ Playwright Chromium 已可用")
+                    return
+
+                # 尝试系统浏览器通道（避免因 Playwright 缓存缺失而强制下载）
+                for channel in ("chrome", "msedge"):
+                    if self.isInterruptionRequested():
+                        return
+                    try:
+                        browser = p.chromium.launch(channel=channel, headless=True, timeout=30_000)
+                        browser.close()
+                        self.log.emit("success", f"✅ 系统浏览器可用（{channel}），无需下载 Playwright Chromium")
+                        return
+                    except Exception:
+                        continue
+
+            if self.isInterruptionRequested():
+                return
+
+            self.log.emit("info", "🔄 Chrome浏览器未安装，正在下载...")
+
+            # 下载Chrome浏览器
+            import subprocess
+
+            # 打包版 exe 无法通过 `sys.executable -m playwright ...` 在线安装浏览器
+            if getattr(sys, "frozen", False):
+                self.log.emit("error", "❌ 检测到浏览器缺失，但当前为打包版本，无法自动下载 Playwright Chromium。")
+                self.log.emit("info", "💡 可能原因：杀毒软件误删了浏览器文件；请将程序目录加入白名单并重新解压完整包。")
+                return
+
+            # 使用playwright install命令下载Chrome
+            try:
+                self.log.emit("info", "📥 正在下载Chrome浏览器，请稍候...")
+                env = os.environ.copy()
+                env.setdefault("PLAYWRIGHT_BROWSERS_PATH", _PLAYWRIGHT_BROWSERS_PATH)
+                if sys.platform == "win32":
+                    env.setdefault("PLAYWRIGHT_DOWNLOAD_HOST", "https://npmmirror.com/mirrors/playwright")
+
+                # 用 Popen 轮询而不是 subprocess.run，以便退出程序时能及时终止下载进程
+                proc = subprocess.Popen(
+                    [sys.executable, "-m", "playwright", "install", "chromium"],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                    env=env,
+                )
+                deadline = time.monotonic() + self.DOWNLOAD_TIMEOUT
+                while True:
+                    try:
+                        _stdout, stderr = proc.communicate(timeout=0.5)
+                        break
+                    except subprocess.TimeoutExpired:
+                        if self.isInterruptionRequested():
+                            proc.kill()
+                            proc.communicate()
+                            return
+                        if time.monotonic() > deadline:
+                            proc.kill()
+                            proc.communicate()
+                            raise
+
+                if proc.returncode == 0:
+                    self.log.emit("success", "✅ Chrome浏览器下载完成")
+
+                    # 需要时（XHS_VERIFY_BROWSER=1）再启动一次浏览器验证安装
+                    if os.environ.get("XHS_VERIFY_BROWSER") == "1":
+                        with sync_playwright() as p2:
+                            try:
+                                browser = p2.chromium.launch(headless=True)
+                                browser.close()
+                                self.log.emit("success", "✅ Chrome浏览器验证成功")
+                            except Exception as verify_error:
+                                self.log.emit("error", f"❌ Chrome浏览器验证失败: {str(verify_error)}")
+                else:
+                    self.log.emit("error", f"❌ Chrome浏览器下载失败: {stderr}")
+                    self.log.emit("info", "💡 您可以手动运行: python -m playwright install chromium")
+
+            except subprocess.TimeoutExpired:
+                self.log.emit("error", "❌ Chrome浏览器下载超时")
+                self.log.emit("info", "💡 请检查网络连接，或手动运行: python -m playwright install chromium")
+            except Exception as download_error:
+                self.log.emit("error", f"❌ Chrome浏览器下载出错: {str(download_error)}")
+                self.log.emit("info", "💡 请手动运行: python -m playwright install chromium")
+
+        except Exception as e:
+            self.log.emit("error", f"❌ Chrome下载器出错: {str(e)}")
+            self.log.emit("info", "💡 浏览器功能将不可用，但不影响其他功能的正常使用")
+
+
 class XiaohongshuUI(QMainWindow):
     def __init__(self):
         super().__init__()
 
-        # 在创建UI之前先初始化数据库
-        init_database_on_startup()
+        # 短时后台任务（数据库初始化等）统一使用线程池，避免每次新建线程
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(max(2, (os.cpu_count() or 2) // 2))
+        self.db_init_task = None
+        self._shutdown_done = False
+        # 等数据库初始化结束后再创建的页面索引（见 switch_page）
+        self._pending_page_index = None
+
+        # 数据库在窗口显示后才于后台初始化；在创建任何页面/浏览器线程前先标记为初始化中，
+        # 使它们调用 wait_ready() 时能真正等到初始化结束
+        from src.core.database_manager import database_manager
+        database_manager.mark_initializing()
 
         self.config = Config()
 
-        # 设置应用图标
-        icon_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "build", "icon.png")
-        if os.path.exists(icon_path):
-            self.app_icon = QIcon(icon_path)
+        # 设置应用图标（应用级图标会作用于所有顶层窗口）
+        self.app_icon = get_app_icon()
+        if self.app_icon is not None:
             QApplication.setWindowIcon(self.app_icon)
-            self.setWindowIcon(self.app_icon)
 
         # 加载logger
         app_config = self.config.get_app_config()
@@ -119,76 +363,7 @@ class XiaohongshuUI(QMainWindow):
 
         self.setWindowTitle("✨ 小红书发文助手")
 
-        self.setStyleSheet(f"""
-            QMainWindow {{
-                background-color: #f8f9fa;
-            }}
-            QLabel {{
-                font-family: {get_ui_text_font_family_css()};
-                color: #34495e;
-                font-size: 11pt;
-                border: none;
-                background: transparent;
-            }}
-            QPushButton {{
-                font-family: {get_ui_text_font_family_css()};
-                font-size: 11pt;
-                font-weight: bold;
-                padding: 6px;
-                background-color: #4a90e2;
-                color: white;
-                border: none;
-                border-radius: 4px;
-            }}
-            QPushButton:hover {{
-                background-color: #357abd;
-            }}
-            QPushButton:disabled {{
-                background-color: #cccccc;
-            }}
-            QLineEdit, QTextEdit, QComboBox {{
-                font-family: {get_ui_text_font_family_css()};
-                font-size: 11pt;
-                padding: 4px;
-                background-color: white;
-                border: 1px solid #ddd;
-                border-radius: 4px;
-            }}
-            QFrame {{
-                background-color: #f8f9fa;
-                border: 1px solid #ddd;
-                border-radius: 6px;
-            }}
-            QScrollArea {{
-                border: none;
-            }}
-            #sidebar {{
-                background-color: #2c3e50;
-                min-width: 60px;
-                max-width: 60px;
-                padding: 20px 0;
-            }}
-            #sidebar QPushButton {{
-                background-color: transparent;
-                border: none;
-                border-radius: 0;
-                color: #ecf0f1;
-                padding: 15px 0;
-                margin: 5px 0;
-                font-size: 20px;
-                font-family: {get_emoji_font_family_css()};
-            }}
-            #sidebar QPushButton:hover {{
-                background-color: #34495e;
-            }}
-            #sidebar QPushButton:checked {{
-                background-color: #34495e;
-            }}
-            #settingsPage {{
-                background-color: white;
-                padding: 20px;
-            }}
-        """)
+        self.setStyleSheet(load_main_stylesheet())
 
         self.setMinimumSize(1200, 780)  # 增大主窗口最小尺寸，提升纵向显示空间
         self.center()
@@ -209,75 +384,21 @@ class XiaohongshuUI(QMainWindow):
         sidebar_layout.setContentsMargins(0, 0, 0, 0)
         sidebar_layout.setSpacing(0)
 
-        # 创建侧边栏按钮
-        home_btn = QPushButton("🏠")
-        home_btn.setCheckable(True)
-        home_btn.setChecked(True)
-        home_btn.clicked.connect(lambda: self.switch_page(0))
-        home_btn.setToolTip("主页")
-
-        # 添加用户管理按钮
-        user_btn = QPushButton("👥")
-        user_btn.setCheckable(True)
-        user_btn.clicked.connect(lambda: self.switch_page(1))
-        user_btn.setToolTip("用户管理")
-
-        # 添加浏览器环境按钮
-        browser_env_btn = QPushButton("🌐")
-        browser_env_btn.setCheckable(True)
-        browser_env_btn.clicked.connect(lambda: self.switch_page(2))
-        browser_env_btn.setToolTip("浏览器环境")
-
-        # 添加后台配置按钮
-        backend_btn = QPushButton("⚙️")
-        backend_btn.setCheckable(True)
-        backend_btn.clicked.connect(lambda: self.switch_page(3))
-        backend_btn.setToolTip("后台配置")
-
-        # 添加封面生成按钮
-        cover_btn = QPushButton("🖼️")
-        cover_btn.setCheckable(True)
-        cover_btn.clicked.connect(lambda: self.switch_page(4))
-        cover_btn.setToolTip("封面中心")
-
-        # 数据中心
-        data_center_btn = QPushButton("📊")
-        data_center_btn.setCheckable(True)
-        data_center_btn.clicked.connect(lambda: self.switch_page(5))
-        data_center_btn.setToolTip("数据中心")
-
-        # 添加工具箱按钮
-        tools_btn = QPushButton("🧰")
-        tools_btn.setCheckable(True)
-        tools_btn.clicked.connect(lambda: self.switch_page(6))
-        tools_btn.setToolTip("工具箱")
-
-        emoji_font = get_emoji_font_family()
-        if emoji_font:
-            sidebar_font_css = f"font-family: '{emoji_font}';"
-            for btn in [
-                home_btn,
-                user_btn,
-                browser_env_btn,
-                backend_btn,
-                cover_btn,
-                data_center_btn,
-                tools_btn,
-            ]:
-                btn.setStyleSheet(sidebar_font_css)
-
-        sidebar_layout.addWidget(home_btn)
-        sidebar_layout.addWidget(user_btn)
-        sidebar_layout.addWidget(browser_env_btn)
-        sidebar_layout.addWidget(backend_btn)
-        sidebar_layout.addWidget(cover_btn)
-        sidebar_layout.addWidget(data_center_btn)
-        sidebar_layout.addWidget(tools_btn)
+        # 创建侧边栏按钮（顺序与页面索引一致）
+        self.sidebar_buttons = []
+        self.sidebar_button_group = QButtonGroup(self)
+        self.sidebar_button_group.setExclusive(True)
+        for index, (icon_text, tooltip) in enumerate(SIDEBAR_SPEC):
+            btn = QPushButton(icon_text)
+            btn.setCheckable(True)
+            btn.setChecked(index == 0)
+            btn.clicked.connect(functools.partial(self.switch_page, index))
+            btn.setToolTip(tooltip)
+            self.sidebar_button_group.addButton(btn, index)
+            sidebar_layout.addWidget(btn)
+            self.sidebar_buttons.append(btn)
         sidebar_layout.addStretch()
 
-        # 存储按钮引用以便切换状态
-        self.sidebar_buttons = [home_btn, user_btn, browser_env_btn, backend_btn, cover_btn, data_center_btn, tools_btn]
-
         # 添加侧边栏到主布局
         main_layout.addWidget(sidebar)
 
@@ -285,61 +406,92 @@ class XiaohongshuUI(QMainWindow):
         self.stack = QStackedWidget()
         main_layout.addWidget(self.stack)
 
-        # 创建并添加页面
-        self.home_page = HomePage(self)
-        self.user_management_page = UserManagementPage(self)
-        self.browser_environment_page = BrowserEnvironmentPage(self)
-        self.backend_config_page = BackendConfigPage(self)
-        self.cover_page = CoverCenterPage(self)
-        self.data_center_page = DataCenterPage(self)
-        self.tools_page = ToolsPage(self)
-
-# 将页面添加到堆叠窗口
-        self.stack.addWidget(self.home_page)
-        self.stack.addWidget(self.user_management_page)
-        self.stack.addWidget(self.browser_environment_page)
-        self.stack.addWidget(self.backend_config_page)
-        self.stack.addWidget(self.cover_page)
-        self.stack.addWidget(self.data_center_page)
-        self.stack.addWidget(self.tools_page)
+        # 页面定义（属性名, 模块, 类名）：主页立即创建，其余页面首次切换时再导入并实例化
+        self._page_specs = {
+            0: ("home_page", "src.core.pages.home", "HomePage"),
+            1: ("user_management_page", "src.core.pages.user_management_page", "UserManagementPage"),
+            2: ("browser_environment_page", "src.core.pages.browser_environment_page", "BrowserEnvironmentPage"),
+            3: ("backend_config_page", "src.core.pages.simple_backend_config", "BackendConfigPage"),
+            4: ("cover_page", "src.core.pages.cover_center_page", "CoverCenterPage"),
+            5: ("data_center_page", "src.core.pages.data_center_page", "DataCenterPage"),
+            6: ("tools_page", "src.core.pages.tools", "ToolsPage"),
+        }
+        self._page_instances = {}
+
+        # 将页面添加到堆叠窗口（未访问的页面先用占位部件）
+        for index in range(len(self._page_specs)):
+            self.stack.addWidget(QWidget())
+        self._ensure_page(0)
+        self.stack.setCurrentIndex(0)
 
         # 创建浏览器线程
+        from src.core.browser import BrowserThread
         self.browser_thread = BrowserThread()
         # 连接信号
-        self.browser_thread.login_status_changed.connect(
-            self.update_login_button)
-        self.browser_thread.preview_status_changed.connect(
-            self.update_preview_button)
-        self.browser_thread.login_success.connect(
-            self.home_page.handle_poster_ready)
-        self.browser_thread.login_error.connect(
-            self.home_page.handle_login_error)
-        self.browser_thread.preview_success.connect(
-            self.home_page.handle_preview_result)
-        self.browser_thread.preview_error.connect(
-            self.home_page.handle_preview_error)
+        for signal_, slot in (
+            (self.browser_thread.login_status_changed, self.update_login_button),
+            (self.browser_thread.preview_status_changed, self.update_preview_button),
+            (self.browser_thread.login_success, self.home_page.handle_poster_ready),
+            (self.browser_thread.login_error, self.home_page.handle_login_error),
+            (self.browser_thread.preview_success, self.home_page.handle_preview_result),
+            (self.browser_thread.preview_error, self.home_page.handle_preview_error),
+        ):
+            signal_.connect(slot)
         self.browser_thread.start()
         
         # 启动定时发布调度器
         from src.core.scheduler.schedule_manager import schedule_manager
         self.schedule_manager = schedule_manager
-        try:
+        for signal_, slot in (
             # 任务到期：派发给浏览器线程执行
-            self.schedule_manager.task_execute_requested.connect(self.enqueue_scheduled_task)
+            (self.schedule_manager.task_execute_requested, self.enqueue_scheduled_task),
             # 浏览器线程回传执行结果：更新任务状态（跨线程安全）
-            self.browser_thread.scheduled_task_result.connect(self.schedule_manager.handle_task_result)
-
+            (self.browser_thread.scheduled_task_result, self.schedule_manager.handle_task_result),
             # 可选：提示执行状态
-            self.schedule_manager.task_started.connect(self.on_scheduled_task_started)
-            self.schedule_manager.task_completed.connect(self.on_scheduled_task_completed)
-            self.schedule_manager.task_failed.connect(self.on_scheduled_task_failed)
-        except Exception as e:
-            print(f"⚠️ 定时发布信号连接失败: {e}")
+            (self.schedule_manager.task_started, self.on_scheduled_task_started),
+            (self.schedule_manager.task_completed, self.on_scheduled_task_completed),
+            (self.schedule_manager.task_failed, self.on_scheduled_task_failed),
+        ):
+            try:
+                signal_.connect(slot)
+            except Exception as e:
+                print(f"⚠️ 定时发布信号连接失败: {e}")
         
         # 启动下载器线程
         self.start_downloader_thread()
 
-        # 启动后同步一次当前用户到UI
+    def showEvent(self, event):
+        super().showEvent(event)
+        # 窗口首次显示后再在后台初始化数据库
+        if self.db_init_task is None:
+            QTimer.singleShot(0, self._deferred_db_init)
+
+    def _deferred_db_init(self):
+        """在线程池中执行数据库初始化"""
+        if self.db_init_task is not None:
+            return
+        from src.core.database_manager import database_manager
+
+        database_manager.mark_initializing()
+        self.db_init_task = BackgroundTask(init_database_on_startup)
+        self.db_init_task.signals.finished.connect(self.on_database_ready)
+        self.thread_pool.start(self.db_init_task)
+
+    def on_database_ready(self, success):
+        """数据库初始化结束后的回调（主线程）"""
+        # 初始化期间切换到的页面此时再创建（失败时也创建，由页面自行处理数据库错误）
+        pending, self._pending_page_index = self._pending_page_index, None
+        if pending is not None:
+            self._ensure_page(pending)
+
+        if not success:
+            try:
+                TipWindow(self, "❌ 数据库初始化失败，请尝试手动修复数据库").show()
+            except Exception:
+                pass
+            return
+
+        # 数据库就绪后同步一次当前用户到UI
         self.sync_current_user_to_ui()
 
     def sync_current_user_to_ui(self):
@@ -372,14 +524,14 @@ class XiaohongshuUI(QMainWindow):
 
     def update_login_button(self, text, enabled):
         """更新登录按钮状态"""
-        login_btn = self.findChild(QPushButton, "login_btn")
+        login_btn = getattr(getattr(self, "home_page", None), "login_btn", None)
         if login_btn:
             login_btn.setText(text)
             login_btn.setEnabled(enabled)
 
     def update_preview_button(self, text, enabled):
         """更新预览按钮状态"""
-        preview_btn = self.findChild(QPushButton, "preview_btn")
+        preview_btn = getattr(getattr(self, "home_page", None), "preview_btn", None)
         if preview_btn:
             preview_btn.setText(text)
             preview_btn.setEnabled(enabled)
@@ -388,25 +540,8 @@ class XiaohongshuUI(QMainWindow):
         """接收调度器的到期任务，并加入浏览器线程队列执行。"""
         try:
             data = task if isinstance(task, dict) else {}
-            self.browser_thread.action_queue.append(
-                {
-                    "type": "scheduled_publish",
-                    "task_id": data.get("task_id"),
-                    "user_id": data.get("user_id"),
-                    "title": data.get("title"),
-                    "content": data.get("content"),
-                    "images": data.get("images"),
-                    # 热点任务相关字段（用于到点重新生成内容/图片）
-                    "task_type": data.get("task_type"),
-                    "interval_hours": data.get("interval_hours"),
-                    "hotspot_source": data.get("hotspot_source"),
-                    "hotspot_rank": data.get("hotspot_rank"),
-                    "use_hotspot_context": data.get("use_hotspot_context"),
-                    "cover_template_id": data.get("cover_template_id"),
-                    "page_count": data.get("page_count"),
-                    "platform": data.get("platform"),
-                    "engine": data.get("engine"),
-                }
+            self.browser_thread.enqueue_action(
+                {"type": "scheduled_publish", **{key: data.get(key) for key in SCHEDULED_TASK_KEYS}}
             )
         except Exception as e:
             task_id = ""
@@ -441,45 +576,47 @@ class XiaohongshuUI(QMainWindow):
         except Exception:
             pass
 
+    def _ensure_page(self, index):
+        """返回指定索引的页面，首次访问时创建并替换占位部件。"""
+        page = self._page_instances.get(index)
+        if page is not None:
+            return page
+
+        attr_name, module_name, class_name = self._page_specs[index]
+        page_cls = getattr(importlib.import_module(module_name), class_name)
+        page = page_cls(self)
+        placeholder = self.stack.widget(index)
+        was_current = self.stack.currentWidget() is placeholder
+        self.stack.insertWidget(index, page)
+        self.stack.removeWidget(placeholder)
+        placeholder.deleteLater()
+        if was_current:
+            self.stack.setCurrentWidget(page)
+
+        self._page_instances[index] = page
+        setattr(self, attr_name, page)
+        return page
+
     def switch_page(self, index):
         """切换页面"""
+        from src.core.database_manager import database_manager
+
+        if index in self._page_instances or database_manager.wait_ready(0):
+            self._ensure_page(index)
+        else:
+            # 页面构造可能查询数据库：先显示占位部件，初始化结束后由 on_database_ready 创建，避免阻塞界面
+            self._pending_page_index = index
         self.stack.setCurrentIndex(index)
-        
-        # 更新按钮状态
-        for i, btn in enumerate(self.sidebar_buttons):
-            btn.setChecked(i == index)
+
+        # 更新按钮状态（按钮组互斥，自动取消其它按钮选中）
+        self.sidebar_button_group.button(index).setChecked(True)
     
 
 
     def closeEvent(self, event):
         print("关闭应用")
         try:
-            # 停止定时发布调度器
-            from src.core.scheduler.schedule_manager import schedule_manager
-            schedule_manager.stop_scheduler()
-            
-            # 停止所有线程
-            if hasattr(self, 'browser_thread'):
-                self.browser_thread.stop()
-                self.browser_thread.wait(1000)  # 等待最多1秒
-                if self.browser_thread.isRunning():
-                    self.browser_thread.terminate()  # 强制终止
-                    self.browser_thread.wait()  # 等待终止完成
-
-            if hasattr(self, 'generator_thread') and self.generator_thread.isRunning():
-                self.generator_thread.terminate()
-                self.generator_thread.wait()
-
-            if hasattr(self, 'image_processor') and self.image_processor.isRunning():
-                self.image_processor.terminate()
-                self.image_processor.wait()
-
-            # 清理资源
-            self.images = []
-            self.image_list = []
-            self.current_image_index = 0
-            # 关闭本机8000端口
-            self.stop_downloader()
+            self.shutdown()
             # 调用父类的closeEvent
             super().closeEvent(event)
 
@@ -487,123 +624,76 @@ class XiaohongshuUI(QMainWindow):
             print(f"关闭应用程序时出错: {str(e)}")
             # 即使出错也强制关闭
             event.accept()
-            
+
+    def shutdown(self):
+        """统一的退出清理（窗口关闭与 QApplication.aboutToQuit 都会调用，只执行一次）"""
+        if self._shutdown_done:
+            return
+        self._shutdown_done = True
+
+        # 停止定时发布调度器
+        from src.core.scheduler.schedule_manager import schedule_manager
+        schedule_manager.stop_scheduler()
+
+        # 停止所有线程
+        if self.db_init_task is not None:
+            from src.core.database_manager import database_manager
+            database_manager.wait_ready(3)  # 数据库初始化较快，等待其完成
+
+        if hasattr(self, 'browser_thread'):
+            self.browser_thread.stop()
+            self.browser_thread.requestInterruption()
+            if not self.browser_thread.wait(1500):
+                # 超时仍未退出才强制终止
+                self.browser_thread.terminate()
+                self.browser_thread.wait(500)
+
+        # 首页生成内容/处理图片时会把线程挂到主窗口上
+        if hasattr(self, 'generator_thread') and self.generator_thread.isRunning():
+            self.generator_thread.terminate()
+            self.generator_thread.wait()
+
+        if hasattr(self, 'image_processor') and self.image_processor.isRunning():
+            self.image_processor.terminate()
+            self.image_processor.wait()
+
+        self.stop_downloader()
+
     def start_downloader_thread(self):
         """启动Chrome下载器线程"""
         try:
-            import threading
-            
-            def download_chrome():
-                """使用Playwright下载Chrome浏览器"""
-                try:
-                    self.logger.info("🔍 检查Chrome浏览器...")
-                    
-                    # 尝试导入playwright
-                    try:
-                        from playwright.sync_api import sync_playwright
-                        self.logger.info("✅ Playwright已安装")
-                    except ImportError:
-                        self.logger.error("❌ Playwright未安装，请运行: pip install playwright")
-                        self.logger.info("💡 浏览器功能将不可用，但不影响其他功能的正常使用")
-                        return
-                    
-                    # 检查Chrome是否已安装
-                    with sync_playwright() as p:
-                        try:
-                            # 优先检查 Playwright 自带 Chromium
-                            browser = p.chromium.launch(headless=True, timeout=30_000)
-                            browser.close()
-                            self.logger.success("✅ Playwright Chromium 已可用")
-                            return
-                        except Exception as e:
-                            if "Executable doesn't exist" in str(e) or "找不到" in str(e):
-                                # 尝试系统浏览器通道（避免因 Playwright 缓存缺失而强制下载）
-                                for channel in ("chrome", "msedge"):
-                                    try:
-                                        browser = p.chromium.launch(channel=channel, headless=True, timeout=30_000)
-                                        browser.close()
-                                        self.logger.success(f"✅ 系统浏览器可用（{channel}），无需下载 Playwright Chromium")
-                                        return
-                                    except Exception:
-                                        continue
-
-                                self.logger.info("🔄 Chrome浏览器未安装，正在下载...")
-                                
-                                # 下载Chrome浏览器
-                                import subprocess
-                                import sys
-
-                                # 打包版 exe 无法通过 `sys.executable -m playwright ...` 在线安装浏览器
-                                if getattr(sys, "frozen", False):
-                                    self.logger.error("❌ 检测到浏览器缺失，但当前为打包版本，无法自动下载 Playwright Chromium。")
-                                    self.logger.info("💡 可能原因：杀毒软件误删了浏览器文件；请将程序目录加入白名单并重新解压完整包。")
-                                    return
-                                
-                                # 使用playwright install命令下载Chrome
-                                try:
-                                    self.logger.info("📥 正在下载Chrome浏览器，请稍候...")
-                                    env = os.environ.copy()
-                                    env.setdefault(
-                                        "PLAYWRIGHT_BROWSERS_PATH",
-                                        os.path.join(os.path.expanduser("~"), ".xhs_system", "ms-playwright"),
-                                    )
-                                    if sys.platform == "win32":
-                                        env.setdefault("PLAYWRIGHT_DOWNLOAD_HOST", "https://npmmirror.com/mirrors/playwright")
-
-                                    result = subprocess.run(
-                                        [sys.executable, "-m", "playwright", "install", "chromium"],
-                                        capture_output=True,
-                                        text=True,
-                                        env=env,
-                                        timeout=1200  # 20分钟超时（部分网络较慢）
-                                    )
-                                    
-                                    if result.returncode == 0:
-                                        self.logger.success("✅ Chrome浏览器下载完成")
-                                        
-                                        # 再次验证安装
-                                        with sync_playwright() as p2:
-                                            try:
-                                                browser = p2.chromium.launch(headless=True)
-                                                browser.close()
-                                                self.logger.success("✅ Chrome浏览器验证成功")
-                                            except Exception as verify_error:
-                                                self.logger.error(f"❌ Chrome浏览器验证失败: {str(verify_error)}")
-                                    else:
-                                        self.logger.error(f"❌ Chrome浏览器下载失败: {result.stderr}")
-                                        self.logger.info("💡 您可以手动运行: python -m playwright install chromium")
-                                        
-                                except subprocess.TimeoutExpired:
-                                    self.logger.error("❌ Chrome浏览器下载超时")
-                                    self.logger.info("💡 请检查网络连接，或手动运行: python -m playwright install chromium")
-                                except Exception as download_error:
-                                    self.logger.error(f"❌ Chrome浏览器下载出错: {str(download_error)}")
-                                    self.logger.info("💡 请手动运行: python -m playwright install chromium")
-                            else:
-                                self.logger.error(f"❌ Chrome浏览器检查失败: {str(e)}")
-                                
-                except Exception as e:
-                    self.logger.error(f"❌ Chrome下载器出错: {str(e)}")
-                    self.logger.info("💡 浏览器功能将不可用，但不影响其他功能的正常使用")
-                    
-            # 创建并启动线程
-            self.downloader_thread = threading.Thread(target=download_chrome, daemon=True)
-            self.downloader_thread.start()
-            
+            self.downloader_thread = ChromeSetupThread()
+            self.downloader_thread.log.connect(self.on_downloader_log)
+            self.downloader_thread.start()
+
         except Exception as e:
             self.logger.error(f"❌ 启动Chrome下载器线程时出错: {str(e)}")
-            
+
+    def on_downloader_log(self, level: str, message: str):
+        """在主线程输出下载器日志"""
+        log_func = getattr(self.logger, level, None) or self.logger.info
+        log_func(message)
+
     def stop_downloader(self):
-        """停止下载器（现在主要是清理资源）"""
+        """停止下载器线程：请求中断（会终止正在运行的下载进程），超时仍未退出则强制终止"""
         try:
-            # 由于我们不再启动服务器进程，这里主要是清理资源
             self.logger.info("ℹ️ 清理浏览器资源")
-            
-            # 如果有正在运行的下载线程，等待其完成
-            if hasattr(self, 'downloader_thread') and self.downloader_thread.is_alive():
-                self.logger.info("ℹ️ 等待Chrome下载完成...")
-                # 不强制终止下载线程，让它自然完成
-                
+
+            thread = getattr(self, 'downloader_thread', None)
+            if thread is not None and thread.isRunning():
+                self.logger.info("ℹ️ 正在停止Chrome下载线程...")
+                # 窗口即将销毁，不再接收下载器日志
+                try:
+                    thread.log.disconnect(self.on_downloader_log)
+                except TypeError:
+                    pass
+                thread.requestInterruption()
+                # 只在步骤之间检查中断：卡在 Playwright 启动/浏览器探测时等待会超时，
+                # 此时强制终止，避免 QThread 在运行中被销毁导致进程异常退出
+                if not thread.wait(3000):
+                    thread.terminate()
+                    thread.wait(500)
+
         except Exception as e:
             self.logger.warning(f"⚠️ 清理浏览器资源时出现问题: {str(e)}")
 
@@ -617,19 +707,19 @@ if __name__ == "__main__":
         def signal_handler(signum, frame):
             print("\n正在退出程序...")
             QApplication.quit()
-        # 注册信号处理器
+        # 注册信号处理器（SIGTERM 同样走正常退出流程，确保浏览器被关闭）
         signal.signal(signal.SIGINT, signal_handler)
+        signal.signal(signal.SIGTERM, signal_handler)
 
         app = QApplication(sys.argv)
         # Prefer a UI font that supports CJK, and let monospace be opt-in per widget.
         app.setFont(ui_font(12))
 
         # 允许 CTRL+C 中断
-        timer = QTimer()
-        timer.timeout.connect(lambda: None)
-        timer.start(100)
+        sigint_wakeup = install_signal_wakeup(app)
 
         window = XiaohongshuUI()
+        app.aboutToQuit.connect(window.shutdown)
         window.show()
         sys.exit(app.exec())
     except Exception as e:
@@ -1,99 +1,362 @@
+import copy
 import json
+import logging
 import os
+from contextlib import contextmanager
+from types import MappingProxyType
+
+logger = logging.getLogger(__name__)
+
+# orjson / ujson 为可选依赖：已安装时用于加速 settings.json 的解析与序列化
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+# 默认写入紧凑格式；设置 XHS_PRETTY_SETTINGS=1 时写入带缩进的格式，便于手动查看
+_PRETTY_SETTINGS = os.environ.get('XHS_PRETTY_SETTINGS') == '1'
+
+
+def _loads(data):
+    """解析配置内容（UTF-8 字节）"""
+    if orjson is not None:
+        return orjson.loads(data)
+    if ujson is not None:
+        return ujson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj):
+    """序列化配置为 UTF-8 字节"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if _PRETTY_SETTINGS:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    if ujson is not None:
+        text = ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False,
+                           indent=4 if _PRETTY_SETTINGS else 0)
+    elif _PRETTY_SETTINGS:
+        text = json.dumps(obj, indent=4, ensure_ascii=False)
+    else:
+        text = json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+    return text.encode('utf-8')
+
+
+# 各配置段的默认值（只读共享，返回给调用方前先复制）
+_DEFAULT_SCHEDULE_CONFIG = {
+    'enabled': False,
+    'schedule_time': '',
+    'interval_hours': 2,
+    'max_posts': 10,
+    'tasks': []
+}
+
+_DEFAULT_MODEL_CONFIG = {
+    'provider': 'OpenAI',
+    'api_key': '',
+    'api_key_name': 'default',
+    'api_endpoint': 'https://api.openai.com/v1/chat/completions',
+    'model_name': 'gpt-3.5-turbo',
+    'prompt_template': 'xiaohongshu_default',
+    'system_prompt': '你是一个小红书内容创作助手，帮助用户生成优质内容',
+    'advanced': {
+        'temperature': 0.7,
+        'max_tokens': 1000,
+        'timeout': 30
+    }
+}
+
+_DEFAULT_API_CONFIG = {
+    'xhs_api_key': '',
+    'xhs_api_secret': '',
+    'image_provider': '本地存储',
+    'image_endpoint': '',
+    'image_access_key': '',
+    'image_secret_key': ''
+}
+
+_DEFAULT_TEMPLATES_CONFIG = {
+    # 系统图片模板目录（可指向 x-auto-publisher 的目录，或导入后的本地目录）
+    'system_templates_dir': '',
+    # 默认内容模板包（如 content_clean_blue）
+    'default_content_pack': '',
+    # 首页默认封面模板（showcase_*.png 的 stem，比如 showcase_social_quote_card_vibrant）
+    'selected_cover_template_id': '',
+    # 仅用于展示
+    'selected_cover_template_display': '',
+    # 营销海报：可选素材（建议透明底 PNG）
+    'marketing_poster_asset_path': '',
+}
+
+# 应用配置目录与配置文件路径（导入时解析一次）
+_APP_CONFIG_DIR = os.path.join(os.path.expanduser('~'), '.xhs_system')
+os.makedirs(_APP_CONFIG_DIR, exist_ok=True)
+_CONFIG_PATH = os.path.join(_APP_CONFIG_DIR, 'settings.json')
+
+# 已加载的配置：配置文件路径 -> ((mtime_ns, size), 配置字典, 文件内容字节)
+# 同一文件未被外部修改时，多个 Config 实例共享同一份配置字典
+_CONFIG_CACHE = {}
+
+
+# 配置修改计数：每次 save_config() 递增，用于让各实例的取值缓存失效
+_config_generation = 0
+
+
+def _file_stamp(path):
+    """返回文件的 (mtime_ns, size)，用于判断缓存是否仍然有效"""
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+def _thaw(value):
+    """把只读默认值转换为可修改的普通 dict"""
+    return dict(value) if isinstance(value, MappingProxyType) else value
+
+
+# 各提供商的默认端点
+_PROVIDER_ENDPOINTS = MappingProxyType({
+    'OpenAI': 'https://api.openai.com/v1/chat/completions',
+    '智谱（GLM）': 'https://open.bigmodel.cn/api/paas/v4/chat/completions',
+    'Anthropic（Claude）': 'https://api.anthropic.com/v1/messages',
+    '阿里云（通义千问）': 'https://dashscope.aliyuncs.com/compatible-mode/v1/chat/completions',
+    '月之暗面（Kimi）': 'https://api.moonshot.cn/v1/chat/completions',
+    '字节跳动（豆包）': 'https://ark.cn-beijing.volces.com/api/v3/chat/completions',
+    '腾讯（混元）': 'https://api.lkeap.cloud.tencent.com/v1/chat/completions',
+    '本地模型': 'http://localhost:1234/v1/chat/completions'
+})
 
 
 class Config:
     """配置管理类"""
+
+    __slots__ = ('config_file', '_config', '_cache', '_cache_generation', '_buffer_depth', '_dirty', '_load_failed')
 
+    # 顶层默认配置（只读，写入 self.config 前先复制）
+    _DEFAULT_CONFIG = MappingProxyType({
+        "app": "debug",
+        "title_edit": MappingProxyType({
+            "author": "小红书",
+            "title": "测试标题",
+        }),
+        "phone": "18888888888",
+    })
+
     def __init__(self):
-        # 获取用户主目录
-        home_dir = os.path.expanduser('~')
-        # 创建应用配置目录
-        app_config_dir = os.path.join(home_dir, '.xhs_system')
-        if not os.path.exists(app_config_dir):
-            os.makedirs(app_config_dir)
-
         # 配置文件路径
-        self.config_file = os.path.join(app_config_dir, 'settings.json')
-
-        self.default_config = {
-            "app": "debug",
-            "title_edit": {
-                "author": "小红书",
-                "title": "测试标题",
-            },
-            "phone": "18888888888",
-        }
-        self.load_config()
+        self.config_file = _CONFIG_PATH
+
+        # buffered() 嵌套深度与期间是否有待写入的修改
+        self._buffer_depth = 0
+        self._dirty = False
+        # 已有配置文件无法读取/解析时为 True：此时内存中是默认配置，禁止写回以免覆盖用户文件
+        self._load_failed = False
+        # 配置内容在首次访问时才加载
+        self._config = None
+        # 顶层配置项的取值缓存及其对应的修改计数
+        self._cache = {}
+        self._cache_generation = _config_generation
+
+    @property
+    def config(self):
+        """配置内容（首次访问时加载）"""
+        if self._config is None:
+            self.load_config()
+        return self._config
+
+    @config.setter
+    def config(self, value):
+        self._config = value
+        self._cache.clear()
+
+    def _get_cached(self, key):
+        """读取顶层配置项（缺失时使用默认值），结果缓存到下一次修改为止"""
+        if self._cache_generation != _config_generation:
+            self._cache.clear()
+            self._cache_generation = _config_generation
+        try:
+            return self._cache[key]
+        except KeyError:
+            value = self.config.get(key)
+            if value is None:
+                value = self._DEFAULT_CONFIG[key]
+            self._cache[key] = value
+            return value
 
     def load_config(self):
         """加载配置"""
+        # 直接 stat 代替 exists 判断：文件不存在时写入默认配置
         try:
-            if os.path.exists(self.config_file):
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    self.config = json.load(f)
-                # 确保所有默认配置项都存在
-                self._ensure_default_config()
-            else:
-                self.config = self.default_config
-                self.save_config()
-        except Exception as e:
-            print(f"加载配置失败: {str(e)}")
-            self.config = self.default_config
-            self.save_config()
+            stamp = _file_stamp(self.config_file)
+        except FileNotFoundError:
+            self.config = self._new_default_config()
+            self.save_config()
+            return
+
+        cached = _CONFIG_CACHE.get(self.config_file)
+        if cached is not None and cached[0] == stamp:
+            self.config = cached[1]
+        else:
+            # 配置文件已存在但无法读取或解析时，使用内存中的默认配置，不覆盖原文件
+            try:
+                # 以二进制整体读入后再解析，解析器直接处理 UTF-8 字节
+                with open(self.config_file, 'rb') as f:
+                    data = f.read()
+                config = _loads(data)
+                if not isinstance(config, dict):
+                    raise ValueError("顶层必须是 JSON 对象")
+            except OSError:
+                logger.exception("读取配置文件失败，暂时使用默认配置: %s", self.config_file)
+                self._load_failed = True
+                self.config = self._new_default_config()
+                return
+            except ValueError:
+                logger.exception("配置文件格式错误，暂时使用默认配置且不覆盖原文件: %s", self.config_file)
+                self._load_failed = True
+                self.config = self._new_default_config()
+                return
+            self.config = config
+            _CONFIG_CACHE[self.config_file] = (stamp, self.config, data)
+        # 确保所有默认配置项都存在
+        self._ensure_default_config()
+
+    @classmethod
+    def _new_default_config(cls):
+        """生成一份可修改的默认配置"""
+        return {key: _thaw(value) for key, value in cls._DEFAULT_CONFIG.items()}
 
     def _ensure_default_config(self):
         """确保所有默认配置项都存在"""
-        # 检查并添加缺失的顶级配置项
-        for key, value in self.default_config.items():
-            if key not in self.config:
-                self.config[key] = value
-        
-        # 检查并添加缺失的嵌套配置项
-        if 'title_edit' in self.config:
-            for key, value in self.default_config['title_edit'].items():
-                if key not in self.config['title_edit']:
-                    self.config['title_edit'][key] = value
-        else:
-            self.config['title_edit'] = self.default_config['title_edit']
-        
-        # 保存更新后的配置
-        self.save_config()
+        # 用字典合并补齐缺失项（已有的值优先），原地更新以保持与缓存共享同一个 dict
+        dirty = not self._DEFAULT_CONFIG.keys() <= self.config.keys()
+        if dirty:
+            self.config.update({**self._new_default_config(), **self.config})
+
+        title_edit = self.config['title_edit']
+        title_defaults = self._DEFAULT_CONFIG['title_edit']
+        if not isinstance(title_edit, dict):
+            self.config['title_edit'] = dict(title_defaults)
+            dirty = True
+        elif not title_defaults.keys() <= title_edit.keys():
+            title_edit.update({**title_defaults, **title_edit})
+            dirty = True
+
+        # 仅在补齐了默认项时保存
+        if dirty:
+            self.save_config()
 
+    @contextmanager
+    def buffered(self):
+        """批量更新：期间的 save_config() 合并为退出时的一次写入
+
+        用法::
+
+            with config.buffered():
+                config.update_phone_config(phone)
+                config.update_title_config(title)
+        """
+        self._buffer_depth += 1
+        try:
+            yield self
+        finally:
+            self._buffer_depth -= 1
+            if self._buffer_depth == 0 and self._dirty:
+                self._dirty = False
+                self._save_now()
+
     def save_config(self):
-        """保存配置"""
+        """保存配置（处于 buffered() 中时延迟到退出时写入）"""
+        # 所有修改（包括直接改 self.config 的调用方）都会走到这里，使取值缓存失效
+        global _config_generation
+        _config_generation += 1
+        if self._buffer_depth:
+            self._dirty = True
+            return
+        self._save_now()
+
+    def _save_now(self):
+        """立即写入配置文件（内容未变化时跳过）"""
+        if self._load_failed:
+            # 内存中只是默认配置，写入会覆盖用户原有的（损坏或暂时无法读取的）配置文件
+            logger.warning("配置文件加载失败，本次修改仅在内存中生效，未写入: %s", self.config_file)
+            return
+
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=4, ensure_ascii=False)
-        except Exception as e:
-            print(f"保存配置失败: {str(e)}")
+            # 先整体序列化再一次性写入，避免 json.dump 逐片段 write。
+            # 每次调用前都可能有原地修改（调用方直接改 self.config 后再保存），
+            # 无法用修改计数证明内容未变，因此总是重新序列化；
+            # 未变化的保存已由 update_*_config 的短路与 buffered() 合并挡在前面
+            data = _dumps(self.config)
+        except (TypeError, ValueError):
+            logger.exception("配置包含无法序列化的值，未保存")
+            return
+
+        try:
+            cached = _CONFIG_CACHE.get(self.config_file)
+            if cached is not None and cached[1] is self.config and cached[2] == data:
+                try:
+                    if _file_stamp(self.config_file) == cached[0]:
+                        return
+                except FileNotFoundError:
+                    pass
+
+            # 先写临时文件再替换，避免写到一半时损坏配置
+            tmp_file = self.config_file + '.tmp'
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_file, self.config_file)
+            # 写入后刷新缓存，后续 Config() 直接复用内存中的配置
+            _CONFIG_CACHE[self.config_file] = (_file_stamp(self.config_file), self.config, data)
+        except OSError:
+            logger.exception("保存配置失败: %s", self.config_file)
 
+    def _update_section(self, key, value):
+        """更新一个配置段，与当前值相同时不保存"""
+        current = self.config.get(key)
+        # 调用方常在 get_*_config() 返回的 dict 上原地修改后再传回（current is value），
+        # 这种情况下无法判断是否有变化，交给 _save_now() 比较序列化结果
+        if current is not value and current == value:
+            return
+        self.config[key] = value
+        self.save_config()
+
     def get_app_config(self):
         """获取app配置"""
-        return self.config.get('app', self.default_config['app'])
+        return self._get_cached('app')
 
     def update_app_config(self, app):
         """更新app配置"""
+        if self.config.get('app') == app:
+            return
         self.config['app'] = app
         self.save_config()
         
     def get_phone_config(self):
         """获取手机号配置"""
-        return self.config.get('phone', self.default_config['phone'])
+        return self._get_cached('phone')
         
     def update_phone_config(self, phone):
         """更新手机号配置"""
+        if self.config.get('phone') == phone:
+            return
         self.config['phone'] = phone
         self.save_config()
 
     def get_title_config(self):
         """获取标题配置"""
-        return self.config.get('title_edit', self.default_config['title_edit'])
+        return self._get_cached('title_edit')
 
     def update_title_config(self, title):
         """更新标题配置"""
         if 'title_edit' not in self.config:
             self.config['title_edit'] = {}
+        elif self.config['title_edit'].get('title') == title:
+            return
         self.config['title_edit']['title'] = title
         self.save_config()
 
@@ -101,94 +364,47 @@ class Config:
         """更新作者配置"""
         if 'title_edit' not in self.config:
             self.config['title_edit'] = {}
+        elif self.config['title_edit'].get('author') == author:
+            return
         self.config['title_edit']['author'] = author
         self.save_config()
 
     def get_schedule_config(self):
         """获取定时发布配置"""
-        return self.config.get('schedule', {
-            'enabled': False,
-            'schedule_time': '',
-            'interval_hours': 2,
-            'max_posts': 10,
-            'tasks': []
-        })
+        value = self.config.get('schedule')
+        return value if value is not None else copy.deepcopy(_DEFAULT_SCHEDULE_CONFIG)
 
     def update_schedule_config(self, schedule_config):
         """更新定时发布配置"""
-        self.config['schedule'] = schedule_config
-        self.save_config()
+        self._update_section('schedule', schedule_config)
 
     def get_model_config(self):
         """获取模型配置"""
-        return self.config.get('model', {
-            'provider': 'OpenAI',
-            'api_key': '',
-            'api_key_name': 'default',
-            'api_endpoint': 'https://api.openai.com/v1/chat/completions',
-            'model_name': 'gpt-3.5-turbo',
-            'prompt_template': 'xiaohongshu_default',
-            'system_prompt': '你是一个小红书内容创作助手，帮助用户生成优质内容',
-            'advanced': {
-                'temperature': 0.7,
-                'max_tokens': 1000,
-                'timeout': 30
-            }
-        })    
+        value = self.config.get('model')
+        return value if value is not None else copy.deepcopy(_DEFAULT_MODEL_CONFIG)
 
     def get_provider_endpoints(self):
-        """获取各提供商的默认端点"""
-        return {
-            'OpenAI': 'https://api.openai.com/v1/chat/completions',
-            '智谱（GLM）': 'https://open.bigmodel.cn/api/paas/v4/chat/completions',
-            'Anthropic（Claude）': 'https://api.anthropic.com/v1/messages',
-            '阿里云（通义千问）': 'https://dashscope.aliyuncs.com/compatible-mode/v1/chat/completions',
-            '月之暗面（Kimi）': 'https://api.moonshot.cn/v1/chat/completions',
-            '字节跳动（豆包）': 'https://ark.cn-beijing.volces.com/api/v3/chat/completions',
-            '腾讯（混元）': 'https://api.lkeap.cloud.tencent.com/v1/chat/completions',
-            '本地模型': 'http://localhost:1234/v1/chat/completions'
-        }
+        """获取各提供商的默认端点（只读）"""
+        return _PROVIDER_ENDPOINTS
 
     def update_model_config(self, model_config):
         """更新模型配置"""
-        self.config['model'] = model_config
-        self.save_config()
+        self._update_section('model', model_config)
 
     def get_api_config(self):
         """获取API配置"""
-        return self.config.get('api', {
-            'xhs_api_key': '',
-            'xhs_api_secret': '',
-            'image_provider': '本地存储',
-            'image_endpoint': '',
-            'image_access_key': '',
-            'image_secret_key': ''
-        })
+        value = self.config.get('api')
+        return value if value is not None else copy.deepcopy(_DEFAULT_API_CONFIG)
 
     def update_api_config(self, api_config):
         """更新API配置"""
-        self.config['api'] = api_config
-        self.save_config()
+        self._update_section('api', api_config)
 
     def get_templates_config(self):
         """获取模板相关配置（文案模板/图片模板等）。"""
-        return self.config.get(
-            'templates',
-            {
-                # 系统图片模板目录（可指向 x-auto-publisher 的目录，或导入后的本地目录）
-                'system_templates_dir': '',
-                # 默认内容模板包（如 content_clean_blue）
-                'default_content_pack': '',
-                # 首页默认封面模板（showcase_*.png 的 stem，比如 showcase_social_quote_card_vibrant）
-                'selected_cover_template_id': '',
-                # 仅用于展示
-                'selected_cover_template_display': '',
-                # 营销海报：可选素材（建议透明底 PNG）
-                'marketing_poster_asset_path': '',
-            },
-        )
+        value = self.config.get('templates')
+        return value if value is not None else copy.deepcopy(_DEFAULT_TEMPLATES_CONFIG)
 
     def update_templates_config(self, templates_config):
         """更新模板相关配置"""
-        self.config['templates'] = templates_config or {}
-        self.save_config()
+        self._update_section('templates', templates_config or {})
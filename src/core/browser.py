@@ -4,13 +4,58 @@ import os
 import random
 import re
 import sys
+import threading
 import time
-from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 
 from src.core.write_xiaohongshu import XiaohongshuPoster
 
+# 手机号规范化：去掉所有非数字字符
+_NON_DIGIT_RE = re.compile(r"\D+")
+
+# 删除所有空白字符（与正则 \s 匹配的字符集合一致，含全角空格）
+_WHITESPACE_TABLE = str.maketrans(
+    "", "",
+    "\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680"
+    "\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a"
+    "\u2028\u2029\u202f\u205f\u3000",
+)
+
+# 各系统对应的浏览器环境指纹特征：(navigator.platform, UA 关键字)
+_OS_ENV_MARKERS = {
+    "darwin": ("MacIntel", "Macintosh"),
+    "win32": ("Win32", "Windows NT"),
+}
+
+
+@lru_cache(maxsize=128)
+def _cover_bg_path(showcase_dir: str, cover_template_id: str, mtime_ns: int) -> str:
+    """showcase 目录下的封面背景图路径（不存在时返回空字符串）"""
+    candidate = os.path.join(showcase_dir, f"{cover_template_id}.png")
+    return candidate if os.path.isfile(candidate) else ""
+
+
+def _env_targets_os(env, os_name: str) -> bool:
+    """环境指纹是否属于指定系统"""
+    platform, ua_marker = _OS_ENV_MARKERS[os_name]
+    return (env.platform or "") == platform or ua_marker in (env.user_agent or "")
+
+
+def _env_matches_current_os(env) -> bool:
+    """环境指纹是否与当前系统一致（仅区分 macOS / Windows，其它系统总是视为一致）"""
+    if sys.platform == "darwin":
+        return not _env_targets_os(env, "win32")
+    if sys.platform == "win32":
+        return not _env_targets_os(env, "darwin")
+    return True
+
 
 class BrowserThread(QThread):
+    # 定时发布临时启动的浏览器空闲多久后关闭（秒），以及检查间隔
+    EPHEMERAL_IDLE_SECONDS = 300
+    EPHEMERAL_REAP_INTERVAL = 30
+
     # 添加信号
     login_status_changed = pyqtSignal(str, bool)  # 用于更新登录按钮状态
     preview_status_changed = pyqtSignal(str, bool)  # 用于更新预览按钮状态
@@ -23,166 +68,348 @@ class BrowserThread(QThread):
     def __init__(self):
         super().__init__()
         self.poster = None
-        self.action_queue = []
+        # asyncio.Queue 在事件循环内创建；循环启动前投递的任务先暂存在 _pending_actions
+        self.action_queue = None
+        self._pending_actions = []
+        self._queue_lock = threading.Lock()
         self.is_running = True
         self.loop = None
+        # 用户 ID -> 与当前系统匹配的浏览器环境（默认环境不匹配时使用）
+        self._env_cache = {}
+        # 数据库相关服务：线程启动时导入一次，不可用时为 None
+        self._user_service = None
+        self._browser_environment_service = None
+        self._config = None
+        # 定时发布临时启动的浏览器：空闲一段时间后再关闭，便于相邻任务复用
+        self._ephemeral_poster = None
+        self._ephemeral_env_id = None
+        self._ephemeral_last_used = 0.0
+        # 正在使用临时浏览器的发布批次数；非 0 时回收任务不会关闭它
+        self._ephemeral_in_use = 0
+        self._reaper_task = None
+        self._background_tasks = set()
+
+    def enqueue_action(self, action):
+        """投递一个浏览器任务（可在任意线程调用；None 表示退出主循环）"""
+        with self._queue_lock:
+            if self.action_queue is None:
+                self._pending_actions.append(action)
+                return
+            loop, action_queue = self.loop, self.action_queue
+        try:
+            loop.call_soon_threadsafe(action_queue.put_nowait, action)
+        except RuntimeError:
+            # 事件循环已关闭：线程已退出，丢弃任务
+            pass
 
     def run(self):
         # 创建新的事件循环
         self.loop = asyncio.new_event_loop()
         asyncio.set_event_loop(self.loop)
         
-        # 在事件循环中运行主循环
-        self.loop.run_until_complete(self.async_run())
-        
-        # 关闭事件循环
-        self.loop.close()
+        try:
+            # 在事件循环中运行主循环
+            self.loop.run_until_complete(self.async_run())
+        finally:
+            # 无论主循环是否异常退出，都释放浏览器资源，避免残留浏览器进程/profile 锁
+            try:
+                self.loop.run_until_complete(self._shutdown_all())
+            except Exception:
+                pass
+            # 关闭事件循环
+            self.loop.close()
         
+    def _load_services(self):
+        """导入浏览器线程用到的数据库服务（只导入一次）"""
+        # 数据库在后台初始化：先等待其结束，之后处理的登录/发布任务才能安全访问用户和环境数据
+        try:
+            from src.core.database_manager import database_manager
+            # 分段等待，以便初始化期间退出程序时线程能及时结束
+            while self.is_running and not database_manager.wait_ready(0.5):
+                pass
+        except Exception:
+            pass
+        try:
+            from src.core.services.user_service import user_service
+        except Exception:
+            user_service = None
+        try:
+            from src.core.services.browser_environment_service import browser_environment_service
+        except Exception:
+            browser_environment_service = None
+        self._user_service = user_service
+        self._browser_environment_service = browser_environment_service
+
+        # 线程内共用一个配置对象；getter 读内存缓存，界面修改后的配置同样可见
+        from src.config.config import Config
+        self._config = Config()
+
     async def async_run(self):
         """异步主循环"""
+        self._load_services()
+        action_queue = asyncio.Queue()
+        with self._queue_lock:
+            for pending in self._pending_actions:
+                action_queue.put_nowait(pending)
+            self._pending_actions.clear()
+            self.action_queue = action_queue
+
+        self._reaper_task = asyncio.create_task(self._ephemeral_reaper())
+
+        # 合并定时发布批次时多取出的下一个任务
+        deferred = []
         while self.is_running:
-            if self.action_queue:
-                action = self.action_queue.pop(0)
-                try:
-                    if action['type'] == 'login':
-                        phone = (action.get('phone') or "").strip()
-                        if not phone:
-                            raise ValueError("手机号不能为空")
+            # 空闲时挂起等待，有任务投递时立即唤醒
+            action = deferred.pop() if deferred else await action_queue.get()
+            if action is None:
+                break
+
+            if action.get('type') == 'scheduled_publish':
+                # 同时到点的定时任务一起取出，按用户/环境共用浏览器会话
+                batch = [action]
+                while not action_queue.empty():
+                    next_action = action_queue.get_nowait()
+                    if next_action is not None and next_action.get('type') == 'scheduled_publish':
+                        batch.append(next_action)
+                    else:
+                        deferred.append(next_action)
+                        break
+                await self._run_scheduled_publish_batch(batch)
+                continue
 
-                        # 根据手机号匹配/创建用户，并作为当前用户
-                        try:
-                            from src.core.services.user_service import user_service
-                        except Exception:
-                            user_service = None
-
-                        current_user = None
-                        if user_service:
-                            current_user = user_service.get_user_by_phone(phone)
-                            if current_user:
-                                user_service.switch_user(current_user.id)
-                            else:
-                                normalized_phone = "".join([c for c in phone if c.isdigit()]) or phone
-                                username_base = f"user_{normalized_phone}"
-                                username = username_base
-                                suffix = 1
-                                while user_service.get_user_by_username(username):
-                                    username = f"{username_base}_{suffix}"
-                                    suffix += 1
-                                current_user = user_service.create_user(
-                                    username=username,
-                                    phone=phone,
-                                    display_name=phone,
-                                    set_current=True,
-                                )
-
-                        # 如果已存在浏览器会话，先关闭避免残留进程导致“偶发启动失败”
-                        if self.poster:
-                            try:
-                                await self.poster.close(force=True)
-                            except Exception:
-                                pass
-                            self.poster = None
-
-                        # 读取当前用户的默认环境（代理/指纹）
-                        browser_env = None
-                        try:
-                            from src.core.services.browser_environment_service import browser_environment_service
-
-                            if current_user:
-                                browser_env = browser_environment_service.get_default_environment(current_user.id)
-                                if not browser_env:
-                                    browser_environment_service.create_preset_environments(current_user.id)
-                                    browser_env = browser_environment_service.get_default_environment(current_user.id)
-
-                                # 若默认环境与当前系统不匹配，优先选择同用户下更贴近当前系统的环境（仅本次会话，不修改默认设置）
-                                if browser_env and sys.platform == "darwin":
-                                    ua = (browser_env.user_agent or "")
-                                    platform = (browser_env.platform or "")
-                                    if "Windows NT" in ua or platform == "Win32":
-                                        browser_environment_service.create_preset_environments(current_user.id)
-                                        envs = browser_environment_service.get_user_environments(current_user.id, active_only=True) or []
-                                        for env in envs:
-                                            if (env.platform or "") == "MacIntel" or "Macintosh" in (env.user_agent or ""):
-                                                print(f"检测到 macOS 系统，默认环境为 Windows 指纹；本次登录临时切换到环境: {env.name}")
-                                                browser_env = env
-                                                break
-                                elif browser_env and sys.platform == "win32":
-                                    ua = (browser_env.user_agent or "")
-                                    platform = (browser_env.platform or "")
-                                    if "Macintosh" in ua or platform == "MacIntel":
-                                        browser_environment_service.create_preset_environments(current_user.id)
-                                        envs = browser_environment_service.get_user_environments(current_user.id, active_only=True) or []
-                                        for env in envs:
-                                            if (env.platform or "") == "Win32" or "Windows NT" in (env.user_agent or ""):
-                                                print(f"检测到 Windows 系统，默认环境为 Mac 指纹；本次登录临时切换到环境: {env.name}")
-                                                browser_env = env
-                                                break
-                        except Exception:
-                            browser_env = None
-
-                        self.poster = XiaohongshuPoster(
-                            user_id=(current_user.id if current_user else None),
-                            browser_environment=browser_env,
-                        )
-                        await self.poster.initialize()
-                        await self.poster.login(phone)
-
-                        if user_service and current_user:
-                            user_service.update_login_status(current_user.id, True)
-
-                        self.login_success.emit(self.poster)
-                    elif action['type'] == 'preview' and self.poster:
-                        await self.poster.post_article(
-                            action['title'],
-                            action['content'],
-                            action['images'],
-                            auto_publish=False,
-                        )
-                        self.preview_success.emit()
-                    elif action['type'] == 'scheduled_publish':
-                        await self._run_scheduled_publish(action)
-                except Exception as e:
-                    if action['type'] == 'login':
-                        # 登录阶段失败时，尽量释放浏览器资源，避免后续启动不稳定
+            try:
+                if action['type'] == 'login':
+                    phone = (action.get('phone') or "").strip()
+                    if not phone:
+                        raise ValueError("手机号不能为空")
+
+                    # 用户/环境查询是同步数据库操作，放到线程池执行，避免阻塞事件循环
+                    loop = asyncio.get_running_loop()
+                    user_service, current_user, browser_env = await loop.run_in_executor(
+                        None, self._resolve_login_context_sync, phone
+                    )
+
+                    # 如果已存在浏览器会话，先关闭避免残留进程导致“偶发启动失败”
+                    await self._close_ephemeral_poster()
+                    if self.poster:
                         try:
-                            if self.poster:
-                                await self.poster.close(force=True)
+                            await self.poster.close(force=True)
                         except Exception:
                             pass
-                        finally:
-                            self.poster = None
+                        self.poster = None
+
+                    self.poster = XiaohongshuPoster(
+                        user_id=(current_user.id if current_user else None),
+                        browser_environment=browser_env,
+                    )
+                    await self.poster.initialize()
+                    await self.poster.login(phone)
+
+                    # 先通知界面，数据库登录状态在后台更新
+                    self.login_success.emit(self.poster)
+
+                    if user_service and current_user:
+                        self._run_in_background(user_service.update_login_status, current_user.id, True)
+                        # 登录成功后重新读取环境，便于用户修改环境后生效
+                        self._env_cache.pop(current_user.id, None)
+                elif action['type'] == 'preview' and self.poster:
+                    await self.poster.post_article(
+                        action['title'],
+                        action['content'],
+                        action['images'],
+                        auto_publish=False,
+                    )
+                    self.preview_success.emit()
+            except Exception as e:
+                if action['type'] == 'login':
+                    # 登录阶段失败时，尽量释放浏览器资源，避免后续启动不稳定
+                    try:
+                        if self.poster:
+                            await self.poster.close(force=True)
+                    except Exception:
+                        pass
+                    finally:
+                        self.poster = None
+
+                    # 登录失败：后台更新数据库状态（不影响错误上报）
+                    phone = (action.get('phone') or "").strip()
+                    if phone:
+                        self._run_in_background(self._mark_login_failed_sync, phone)
+
+                    msg = str(e)
+                    if "Executable doesn't exist" in msg:
+                        msg += "\n\n可能原因：Playwright 浏览器未安装/被杀毒清理。"
+                        msg += "\n解决："
+                        msg += "\n  - macOS/Linux："
+                        msg += "\n    PLAYWRIGHT_BROWSERS_PATH=\"$HOME/.xhs_system/ms-playwright\" python -m playwright install chromium"
+                        msg += "\n  - Windows（PowerShell）："
+                        msg += "\n    $env:PLAYWRIGHT_BROWSERS_PATH=\"$HOME\\.xhs_system\\ms-playwright\"; python -m playwright install chromium"
+                    self.login_error.emit(msg)
+                elif action['type'] == 'preview':
+                    self.preview_error.emit(str(e))
+
+    def _run_in_background(self, func, *args):
+        """在线程池执行不影响后续流程的同步操作，不等待结果"""
+        future = asyncio.get_running_loop().run_in_executor(None, func, *args)
+        self._background_tasks.add(future)
+        future.add_done_callback(self._on_background_done)
+
+    def _on_background_done(self, future):
+        self._background_tasks.discard(future)
+        if not future.cancelled():
+            # 取出异常，避免 "exception was never retrieved" 警告
+            future.exception()
+
+    async def _shutdown_all(self):
+        """线程退出前的清理：停止空闲检查并关闭所有浏览器"""
+        # 等待后台数据库更新完成，避免退出时丢失登录状态
+        if self._background_tasks:
+            await asyncio.gather(*list(self._background_tasks), return_exceptions=True)
+
+        reaper, self._reaper_task = self._reaper_task, None
+        if reaper and not reaper.done():
+            reaper.cancel()
+            try:
+                await reaper
+            except asyncio.CancelledError:
+                pass
 
-                        # 登录失败：更新数据库状态（不影响错误上报）
-                        try:
-                            from src.core.services.user_service import user_service
+        await self._close_ephemeral_poster()
 
-                            phone = (action.get('phone') or "").strip()
-                            if phone:
-                                u = user_service.get_user_by_phone(phone)
-                                if u:
-                                    user_service.update_login_status(u.id, False)
-                        except Exception:
-                            pass
+        poster, self.poster = self.poster, None
+        if poster:
+            try:
+                await poster.close(force=True)
+            except Exception:
+                pass
+
+    async def _ephemeral_reaper(self):
+        """定期关闭空闲超时的临时浏览器"""
+        while True:
+            await asyncio.sleep(self.EPHEMERAL_REAP_INTERVAL)
+            if self._ephemeral_in_use:
+                continue
+            if self._ephemeral_poster and time.monotonic() - self._ephemeral_last_used > self.EPHEMERAL_IDLE_SECONDS:
+                await self._close_ephemeral_poster()
+
+    async def _close_ephemeral_poster(self):
+        """关闭定时发布临时启动的浏览器（如有）"""
+        poster, self._ephemeral_poster = self._ephemeral_poster, None
+        self._ephemeral_env_id = None
+        if poster:
+            try:
+                await poster.close(force=True)
+            except Exception:
+                pass
+
+    def _resolve_login_context_sync(self, phone: str):
+        """根据手机号匹配/创建当前用户并读取其浏览器环境（同步，便于放入线程池执行）。
+
+        返回 (user_service, current_user, browser_env)；用户服务不可用时 user_service 为 None。
+        """
+        # 根据手机号匹配/创建用户，并作为当前用户
+        user_service = self._user_service
+        current_user = None
+        if user_service:
+            current_user = user_service.get_user_by_phone(phone)
+            if current_user:
+                user_service.switch_user(current_user.id)
+            else:
+                normalized_phone = _NON_DIGIT_RE.sub("", phone) or phone
+                username_base = f"user_{normalized_phone}"
+                # 一次取回所有同前缀用户名，在内存中找出第一个可用的后缀
+                taken = user_service.list_usernames_with_prefix(username_base)
+                username = username_base
+                suffix = 1
+                while username in taken:
+                    username = f"{username_base}_{suffix}"
+                    suffix += 1
+                current_user = user_service.create_user(
+                    username=username,
+                    phone=phone,
+                    display_name=phone,
+                    set_current=True,
+                )
+
+        # 读取当前用户的默认环境（代理/指纹）
+        browser_env = None
+        browser_environment_service = self._browser_environment_service
+        try:
+            if current_user and browser_environment_service:
+                browser_env = browser_environment_service.get_default_environment(current_user.id)
+                if not browser_env:
+                    browser_environment_service.create_preset_environments(current_user.id)
+                    browser_env = browser_environment_service.get_default_environment(current_user.id)
+
+                # 若默认环境与当前系统不匹配，优先选择同用户下更贴近当前系统的环境（仅本次会话，不修改默认设置）
+                if browser_env and not _env_matches_current_os(browser_env):
+                    matched = self._select_matching_env(current_user.id)
+                    if matched:
+                        print(f"检测到默认环境与当前系统（{sys.platform}）指纹不一致；本次登录临时切换到环境: {matched.name}")
+                        browser_env = matched
+        except Exception:
+            browser_env = None
+
+        return user_service, current_user, browser_env
+
+    def _select_matching_env(self, user_id: int):
+        """选择该用户下与当前系统匹配的浏览器环境（同步，结果按用户缓存）。"""
+        if user_id in self._env_cache:
+            return self._env_cache[user_id]
+
+        browser_environment_service = self._browser_environment_service
+        if not browser_environment_service:
+            return None
+
+        browser_environment_service.create_preset_environments(user_id)
+        envs = browser_environment_service.get_user_environments(user_id, active_only=True) or []
+        matched = next((env for env in envs if _env_targets_os(env, sys.platform)), None)
+        self._env_cache[user_id] = matched
+        return matched
 
-                        msg = str(e)
-                        if "Executable doesn't exist" in msg:
-                            msg += "\n\n可能原因：Playwright 浏览器未安装/被杀毒清理。"
-                            msg += "\n解决："
-                            msg += "\n  - macOS/Linux："
-                            msg += "\n    PLAYWRIGHT_BROWSERS_PATH=\"$HOME/.xhs_system/ms-playwright\" python -m playwright install chromium"
-                            msg += "\n  - Windows（PowerShell）："
-                            msg += "\n    $env:PLAYWRIGHT_BROWSERS_PATH=\"$HOME\\.xhs_system\\ms-playwright\"; python -m playwright install chromium"
-                        self.login_error.emit(msg)
-                    elif action['type'] == 'preview':
-                        self.preview_error.emit(str(e))
-                    elif action['type'] == 'scheduled_publish':
-                        task_id = str(action.get('task_id') or "")
-                        self.scheduled_task_result.emit(task_id, False, str(e))
-            # 使用异步sleep而不是QThread.msleep
-            await asyncio.sleep(0.1)  # 避免CPU占用过高
-
-    async def _run_scheduled_publish(self, action: dict):
-        """执行定时发布（无人值守，自动点击发布）。"""
+    def _mark_login_failed_sync(self, phone: str):
+        """登录失败时更新该手机号对应用户的登录状态（同步）。"""
+        user_service = self._user_service
+        if not user_service:
+            return
+
+        u = user_service.get_user_by_phone(phone)
+        if u:
+            user_service.update_login_status(u.id, False)
+
+    @staticmethod
+    def _filter_existing_images(images) -> list:
+        """过滤出真实存在的图片路径（保持原顺序）。
+
+        同一目录下的多张图片只 scandir 一次，避免逐个 stat。
+        """
+        if not isinstance(images, (list, tuple)):
+            return []
+        candidates = [p for p in images if isinstance(p, str) and p]
+
+        groups = {}
+        for p in candidates:
+            groups.setdefault(os.path.dirname(p), []).append(p)
+
+        existing = set()
+        for directory, paths in groups.items():
+            if len(paths) == 1:
+                if os.path.isfile(paths[0]):
+                    existing.add(paths[0])
+                continue
+            try:
+                with os.scandir(directory or ".") as it:
+                    names = {entry.name for entry in it if entry.is_file()}
+            except OSError:
+                names = set()
+            # 名称不在列表中时再逐个确认：大小写不敏感的文件系统（macOS/Windows）上
+            # 路径大小写可能与目录中的实际文件名不同，但文件依然存在
+            existing.update(p for p in paths if os.path.basename(p) in names or os.path.isfile(p))
+
+        return [p for p in candidates if p in existing]
+
+    async def _prepare_scheduled_publish(self, action: dict) -> dict:
+        """准备一个定时发布任务的标题/正文/图片与浏览器环境。"""
         task_id = str(action.get("task_id") or "")
         user_id = action.get("user_id")
         task_type = str(action.get("task_type") or "fixed").strip() or "fixed"
@@ -190,21 +417,14 @@ class BrowserThread(QThread):
         content = str(action.get("content") or "")
         images = action.get("images") or []
 
-        if isinstance(images, (list, tuple)):
-            images = [p for p in images if isinstance(p, str) and p and os.path.isfile(p)]
-        else:
-            images = []
+        images = self._filter_existing_images(images)
 
         if task_type == "hotspot":
-            loop = asyncio.get_running_loop()
-            payload = await loop.run_in_executor(None, partial(self._build_hotspot_payload_sync, action))
+            payload = await self._build_hotspot_payload_async(action)
             title = str(payload.get("title") or "").strip()
             content = str(payload.get("content") or "").strip()
             images = payload.get("images") or []
-            if isinstance(images, (list, tuple)):
-                images = [p for p in images if isinstance(p, str) and p and os.path.isfile(p)]
-            else:
-                images = []
+            images = self._filter_existing_images(images)
 
             if not title and not content:
                 raise RuntimeError("热点任务生成文案失败：标题/内容为空")
@@ -222,83 +442,119 @@ class BrowserThread(QThread):
                 except Exception:
                     page_count = 3
                 page_count = max(1, page_count)
-                images = self._generate_images_for_text(title=title, content=content, cover_template_id=cover_template_id, page_count=page_count)
-                if isinstance(images, (list, tuple)):
-                    images = [p for p in images if isinstance(p, str) and p and os.path.isfile(p)]
-                else:
-                    images = []
+                images = await asyncio.get_running_loop().run_in_executor(
+                    None,
+                    partial(self._generate_images_for_text, title=title, content=content, cover_template_id=cover_template_id, page_count=page_count),
+                )
+                images = self._filter_existing_images(images)
 
         # 默认使用当前用户
         if not user_id:
             try:
-                from src.core.services.user_service import user_service
-
-                current_user = user_service.get_current_user()
+                current_user = self._user_service.get_current_user()
                 user_id = current_user.id if current_user else None
             except Exception:
                 user_id = None
 
+        # 只转换一次，后续统一使用 uid
+        uid = int(user_id) if user_id else None
+
         # 读取该用户默认浏览器环境（代理/指纹）
         browser_env = None
+        browser_environment_service = self._browser_environment_service
         try:
-            from src.core.services.browser_environment_service import browser_environment_service
-
-            if user_id:
-                browser_env = browser_environment_service.get_default_environment(int(user_id))
+            if uid is not None and browser_environment_service:
+                browser_env = browser_environment_service.get_default_environment(uid)
                 if not browser_env:
-                    browser_environment_service.create_preset_environments(int(user_id))
-                    browser_env = browser_environment_service.get_default_environment(int(user_id))
+                    browser_environment_service.create_preset_environments(uid)
+                    browser_env = browser_environment_service.get_default_environment(uid)
 
                 # 定时任务同样优先使用与当前系统匹配的环境（避免 UA/platform 与 OS 不一致触发风控）
-                if browser_env and sys.platform == "darwin":
-                    ua = (browser_env.user_agent or "")
-                    platform = (browser_env.platform or "")
-                    if "Windows NT" in ua or platform == "Win32":
-                        browser_environment_service.create_preset_environments(int(user_id))
-                        envs = browser_environment_service.get_user_environments(int(user_id), active_only=True) or []
-                        for env in envs:
-                            if (env.platform or "") == "MacIntel" or "Macintosh" in (env.user_agent or ""):
-                                browser_env = env
-                                break
-                elif browser_env and sys.platform == "win32":
-                    ua = (browser_env.user_agent or "")
-                    platform = (browser_env.platform or "")
-                    if "Macintosh" in ua or platform == "MacIntel":
-                        browser_environment_service.create_preset_environments(int(user_id))
-                        envs = browser_environment_service.get_user_environments(int(user_id), active_only=True) or []
-                        for env in envs:
-                            if (env.platform or "") == "Win32" or "Windows NT" in (env.user_agent or ""):
-                                browser_env = env
-                                break
+                if browser_env and not _env_matches_current_os(browser_env):
+                    browser_env = self._select_matching_env(uid) or browser_env
         except Exception:
             browser_env = None
 
         if not images:
             raise RuntimeError("发布失败：缺少图片（小红书图文发布需要图片）")
 
-        poster = None
-        poster_is_ephemeral = False
+        return {
+            "task_id": task_id,
+            "user_id": uid,
+            "browser_env": browser_env,
+            "title": title,
+            "content": content,
+            "images": images,
+        }
+
+    async def _run_scheduled_publish_batch(self, actions: list):
+        """执行一批定时发布（无人值守，自动点击发布）。
+
+        同一用户、同一浏览器环境的任务共用一个浏览器会话，只启动一次浏览器。
+        """
+        groups = {}
+        for action in actions:
+            try:
+                job = await self._prepare_scheduled_publish(action)
+            except Exception as e:
+                self.scheduled_task_result.emit(str(action.get("task_id") or ""), False, str(e))
+                continue
+            key = (job["user_id"], getattr(job["browser_env"], "id", None))
+            groups.setdefault(key, []).append(job)
+
+        for (target_uid, _env_id), jobs in groups.items():
+            await self._publish_jobs(target_uid, jobs)
+
+    async def _publish_jobs(self, target_uid, jobs: list):
+        """在同一个浏览器会话中依次发布多个任务，逐个上报结果。"""
+        env_id = getattr(jobs[0]["browser_env"], "id", None)
+        # 优先复用当前线程已登录的 poster，避免 persistent profile 目录被同时打开导致启动失败。
+        if self.poster and getattr(self.poster, "user_id", None) == target_uid:
+            poster = self.poster
+        elif (
+            self._ephemeral_poster
+            and getattr(self._ephemeral_poster, "user_id", None) == target_uid
+            and self._ephemeral_env_id == env_id
+        ):
+            # 复用上一次定时发布启动、尚未空闲超时的浏览器
+            poster = self._ephemeral_poster
+        else:
+            await self._close_ephemeral_poster()
+            poster = XiaohongshuPoster(user_id=target_uid, browser_environment=jobs[0]["browser_env"])
+            self._ephemeral_poster = poster
+            self._ephemeral_env_id = env_id
+
+        is_ephemeral = poster is self._ephemeral_poster
+        if is_ephemeral:
+            # 选定即标记为使用中：初始化和发布可能耗时较长，期间不能被回收任务关闭
+            self._ephemeral_last_used = time.monotonic()
+            self._ephemeral_in_use += 1
         try:
-            target_uid = int(user_id) if user_id else None
-
-            # 优先复用当前线程已登录的 poster，避免 persistent profile 目录被同时打开导致启动失败。
-            if self.poster and getattr(self.poster, "user_id", None) == target_uid:
-                poster = self.poster
-            else:
-                poster = XiaohongshuPoster(user_id=target_uid, browser_environment=browser_env)
-                poster_is_ephemeral = True
+            try:
+                await poster.initialize()
+            except Exception as e:
+                if is_ephemeral and poster is self._ephemeral_poster:
+                    await self._close_ephemeral_poster()
+                for job in jobs:
+                    self.scheduled_task_result.emit(job["task_id"], False, str(e))
+                return
+
+            failed = False
+            for job in jobs:
+                try:
+                    await poster.post_article(job["title"], job["content"], job["images"], auto_publish=True)
+                    self.scheduled_task_result.emit(job["task_id"], True, "")
+                except Exception as e:
+                    failed = True
+                    self.scheduled_task_result.emit(job["task_id"], False, str(e))
 
-            await poster.initialize()
-            await poster.post_article(title, content, images, auto_publish=True)
-            self.scheduled_task_result.emit(task_id, True, "")
-        except Exception as e:
-            self.scheduled_task_result.emit(task_id, False, str(e))
+            # 发布出错时浏览器状态不可信，不再保留给后续任务复用
+            if failed and is_ephemeral and poster is self._ephemeral_poster:
+                await self._close_ephemeral_poster()
         finally:
-            try:
-                if poster and poster_is_ephemeral:
-                    await poster.close(force=True)
-            except Exception:
-                pass
+            if is_ephemeral:
+                self._ephemeral_in_use -= 1
+                self._ephemeral_last_used = time.monotonic()
 
     @classmethod
     def _generate_images_for_text(cls, *, title: str, content: str, cover_template_id: str = "", page_count: int = 3):
@@ -314,19 +570,9 @@ class BrowserThread(QThread):
 
         images = []
         try:
-            from pathlib import Path
             from src.core.services.system_image_template_service import system_image_template_service
 
-            cover_bg = ""
-            try:
-                if cover_template_id:
-                    showcase_dir = system_image_template_service.resolve_showcase_dir()
-                    if showcase_dir:
-                        candidate = Path(showcase_dir) / f"{cover_template_id}.png"
-                        if candidate.exists():
-                            cover_bg = str(candidate)
-            except Exception:
-                cover_bg = ""
+            cover_bg = cls._resolve_cover_bg(system_image_template_service, cover_template_id)
 
             generated = system_image_template_service.generate_post_images(
                 title=title or content or "标题",
@@ -353,7 +599,7 @@ class BrowserThread(QThread):
     @staticmethod
     def _fallback_generate_xhs_content(topic: str) -> dict:
         topic = str(topic or "").strip() or "这个话题"
-        base = re.sub(r"\s+", "", topic)[:10] or "这个话题"
+        base = topic.translate(_WHITESPACE_TABLE)[:10] or "这个话题"
 
         title_templates = [
             f"{base}真的有用吗 先看这3点",
@@ -381,21 +627,20 @@ class BrowserThread(QThread):
         seen = set()
         uniq = []
         for t in tags:
-            t = re.sub(r"\s+", "", str(t))
+            t = str(t).translate(_WHITESPACE_TABLE)
             if not t or t in seen:
                 continue
             seen.add(t)
             uniq.append(t)
         uniq = uniq[:10]
 
-        content = "\n\n".join(
-            [
-                f"今天刷到「{topic}」，我快速整理了一个更好上手的思路：",
-                "先看重点：\n" + "\n".join([f"{i+1}. {x}" for i, x in enumerate(tips)]),
-                "你可以这样做：\n" + "\n".join([f"{i+1}. {x}" for i, x in enumerate(actions)]),
-                "话题标签：" + " ".join(uniq),
-            ]
-        ).strip()
+        # 逐行追加后一次性拼接
+        lines = [f"今天刷到「{topic}」，我快速整理了一个更好上手的思路：", "", "先看重点："]
+        lines.extend(f"{i}. {x}" for i, x in enumerate(tips, 1))
+        lines.extend(("", "你可以这样做："))
+        lines.extend(f"{i}. {x}" for i, x in enumerate(actions, 1))
+        lines.extend(("", "话题标签：" + " ".join(uniq)))
+        content = "\n".join(lines).strip()
 
         return {"title": title, "content": content}
 
@@ -409,34 +654,73 @@ class BrowserThread(QThread):
         base_dir = os.path.join(os.path.expanduser("~"), ".xhs_system", "generated_imgs")
         os.makedirs(base_dir, exist_ok=True)
 
-        def _make(path: str, label: str):
-            width, height = 1080, 1440
-            img = Image.new("RGB", (width, height), (245, 245, 245))
+        # 背景与字体只准备一次，每张图在背景副本上绘制
+        background = Image.new("RGB", (1080, 1440), (245, 245, 245))
+        try:
+            font = ImageFont.load_default()
+        except Exception:
+            font = None
+
+        def _make(label: str):
+            img = background.copy()
             draw = ImageDraw.Draw(img)
-            try:
-                font = ImageFont.load_default()
-            except Exception:
-                font = None
             text = f"{label}\n{(title or '').strip()[:40]}"
             draw.multiline_text((60, 80), text, fill=(30, 30, 30), font=font, spacing=10)
-            img.save(path, format="JPEG", quality=90)
+            return img
+
+        def _save(item):
+            img, path = item
+            # 占位图无需优化/渐进编码，使用最快的 JPEG 编码参数
+            img.save(path, format="JPEG", quality=90, optimize=False, progressive=False, subsampling=2)
 
         ts = int(time.time())
         unique = f"{ts}_{random.randint(1000, 9999)}"
         cover_path = os.path.join(base_dir, f"cover_{unique}.jpg")
-        _make(cover_path, "封面")
+        content_paths = [
+            os.path.join(base_dir, f"content_{i+1}_{unique}.jpg") for i in range(max(1, int(count)))
+        ]
 
-        content_paths = []
-        for i in range(max(1, int(count))):
-            p = os.path.join(base_dir, f"content_{i+1}_{unique}.jpg")
-            _make(p, f"内容图{i+1}")
-            content_paths.append(p)
+        # 绘制很快且共享字体对象，在当前线程完成；JPEG 编码会释放 GIL，放到线程池并行
+        items = [(_make("封面"), cover_path)]
+        items += [(_make(f"内容图{i+1}"), p) for i, p in enumerate(content_paths)]
+        with ThreadPoolExecutor(max_workers=min(8, len(items), os.cpu_count() or 4)) as executor:
+            list(executor.map(_save, items))
 
         return cover_path, content_paths
 
-    @classmethod
-    def _build_hotspot_payload_sync(cls, action: dict) -> dict:
-        """生成热点定时任务的标题/内容/图片（同步，便于放入线程池执行）。"""
+    @staticmethod
+    def _resolve_cover_bg(system_image_template_service, cover_template_id: str) -> str:
+        """封面模板 ID -> 背景图路径（不存在时返回空字符串）。"""
+        try:
+            if cover_template_id:
+                showcase_dir = system_image_template_service.resolve_showcase_dir()
+                if showcase_dir:
+                    showcase_dir = str(showcase_dir)
+                    # 以目录 mtime 作为缓存键：模板增删后目录 mtime 变化，缓存自动失效
+                    return _cover_bg_path(showcase_dir, cover_template_id, os.stat(showcase_dir).st_mtime_ns)
+        except Exception:
+            pass
+        return ""
+
+    @staticmethod
+    def _generate_marketing_poster_content_sync(llm_service, topic: str):
+        """生成营销海报文案（同步；失败返回 None）。"""
+        try:
+            return llm_service.generate_marketing_poster_content(topic=topic)
+        except Exception:
+            return None
+
+    async def _build_hotspot_payload_async(self, action: dict) -> dict:
+        """生成热点定时任务的标题/内容/图片。
+
+        网络请求与图片生成都是阻塞调用，逐个放入线程池执行；
+        互不依赖的步骤（营销海报文案、封面背景查找与摘要抓取/文案生成）并行进行。
+        """
+        loop = asyncio.get_running_loop()
+
+        def run_blocking(func, *args, **kwargs):
+            return loop.run_in_executor(None, partial(func, *args, **kwargs))
+
         source = str(action.get("hotspot_source") or "weibo").strip().lower() or "weibo"
         try:
             rank = int(action.get("hotspot_rank") or 1)
@@ -452,10 +736,23 @@ class BrowserThread(QThread):
             page_count = 3
         page_count = max(1, page_count)
 
-        from src.config.config import Config
         from src.core.services.hotspot_service import hotspot_service
 
-        items = hotspot_service.fetch(source, limit=max(50, rank))
+        # 可选服务在开头一次性导入；不可用时对应步骤回退到本地生成
+        try:
+            from src.core.services.llm_service import llm_service
+        except Exception:
+            llm_service = None
+        try:
+            from src.core.services.marketing_poster_service import marketing_poster_service
+        except Exception:
+            marketing_poster_service = None
+        try:
+            from src.core.services.system_image_template_service import system_image_template_service
+        except Exception:
+            system_image_template_service = None
+
+        items = await run_blocking(hotspot_service.fetch, source, limit=max(50, rank))
         if not items:
             raise RuntimeError(f"热点抓取失败：{source} 无数据")
         item = items[rank - 1] if len(items) >= rank else items[0]
@@ -463,10 +760,18 @@ class BrowserThread(QThread):
         if not topic:
             raise RuntimeError("热点抓取失败：标题为空")
 
+        # 以下两步只依赖热点标题，先行启动，与摘要抓取/文案生成并行
+        poster_future = None
+        if cover_template_id == "showcase_marketing_poster" and llm_service and marketing_poster_service:
+            poster_future = run_blocking(self._generate_marketing_poster_content_sync, llm_service, topic)
+        cover_bg_future = None
+        if cover_template_id and system_image_template_service:
+            cover_bg_future = run_blocking(self._resolve_cover_bg, system_image_template_service, cover_template_id)
+
         context_text = ""
         if use_ctx:
             try:
-                snippets = hotspot_service.fetch_baidu_search_snippets(topic, limit=3, timeout=10)
+                snippets = await run_blocking(hotspot_service.fetch_baidu_search_snippets, topic, limit=3, timeout=10)
                 parts = []
                 for s in snippets:
                     snip = str((s or {}).get("snippet") or "").strip()
@@ -476,8 +781,7 @@ class BrowserThread(QThread):
             except Exception:
                 context_text = ""
 
-        cfg = Config()
-        title_cfg = cfg.get_title_config() if hasattr(cfg, "get_title_config") else {}
+        title_cfg = self._config.get_title_config() if self._config else {}
         header_title = str((title_cfg or {}).get("title") or "").strip()
         author = str((title_cfg or {}).get("author") or "").strip()
 
@@ -488,9 +792,10 @@ class BrowserThread(QThread):
         generated_title = ""
         generated_content = ""
         try:
-            from src.core.services.llm_service import llm_service
-
-            resp = llm_service.generate_xiaohongshu_content(
+            if llm_service is None:
+                raise RuntimeError("LLM 服务不可用")
+            resp = await run_blocking(
+                llm_service.generate_xiaohongshu_content,
                 topic=llm_topic,
                 header_title=header_title,
                 author=author,
@@ -498,7 +803,7 @@ class BrowserThread(QThread):
             generated_title = str(getattr(resp, "title", "") or "").strip()
             generated_content = str(getattr(resp, "content", "") or "").strip()
         except Exception:
-            fallback = cls._fallback_generate_xhs_content(topic)
+            fallback = self._fallback_generate_xhs_content(topic)
             generated_title = str(fallback.get("title") or "").strip()
             generated_content = str(fallback.get("content") or "").strip()
 
@@ -507,14 +812,13 @@ class BrowserThread(QThread):
 
         # 生成图片：优先使用封面模板（含营销海报特殊逻辑），否则使用系统模板；最后回退本地占位图
         images = []
-        if cover_template_id == "showcase_marketing_poster":
+        if poster_future is not None:
+            poster_content = await poster_future
             try:
-                from src.core.services.llm_service import llm_service
-                from src.core.services.marketing_poster_service import marketing_poster_service
-
-                poster_content = llm_service.generate_marketing_poster_content(topic=topic)
+                if poster_content is None:
+                    raise RuntimeError("营销海报文案生成失败")
                 try:
-                    asset_path = str(Config().get_templates_config().get("marketing_poster_asset_path") or "").strip()
+                    asset_path = str(self._config.get_templates_config().get("marketing_poster_asset_path") or "").strip()
                 except Exception:
                     asset_path = ""
                 asset_path = os.path.expanduser(asset_path) if asset_path else ""
@@ -523,7 +827,7 @@ class BrowserThread(QThread):
                         poster_content["asset_image_path"] = asset_path
                     except Exception:
                         pass
-                cover_path, content_paths = marketing_poster_service.generate_to_local_paths(poster_content)
+                cover_path, content_paths = await run_blocking(marketing_poster_service.generate_to_local_paths, poster_content)
                 t = str((poster_content or {}).get("title") or "").strip()
                 if t:
                     generated_title = t
@@ -537,23 +841,11 @@ class BrowserThread(QThread):
             except Exception:
                 images = []
 
-        if not images:
+        cover_bg = await cover_bg_future if cover_bg_future is not None else ""
+        if not images and system_image_template_service:
             try:
-                from pathlib import Path
-                from src.core.services.system_image_template_service import system_image_template_service
-
-                cover_bg = ""
-                try:
-                    if cover_template_id:
-                        showcase_dir = system_image_template_service.resolve_showcase_dir()
-                        if showcase_dir:
-                            candidate = Path(showcase_dir) / f"{cover_template_id}.png"
-                            if candidate.exists():
-                                cover_bg = str(candidate)
-                except Exception:
-                    cover_bg = ""
-
-                generated = system_image_template_service.generate_post_images(
+                generated = await run_blocking(
+                    system_image_template_service.generate_post_images,
                     title=generated_title or topic,
                     content=generated_content or topic,
                     page_count=page_count,
@@ -567,13 +859,15 @@ class BrowserThread(QThread):
                 images = []
 
         if not images:
-            cover_path, content_paths = cls._generate_local_placeholder_images(generated_title or topic, count=max(2, page_count))
+            cover_path, content_paths = await run_blocking(
+                self._generate_local_placeholder_images, generated_title or topic, count=max(2, page_count)
+            )
             images = [cover_path] + list(content_paths or [])
 
         return {"title": generated_title, "content": generated_content, "images": images, "hotspot_title": topic, "hotspot_source": source, "hotspot_rank": rank}
 
     def stop(self):
         self.is_running = False
-        # 确保浏览器资源被释放
-        if self.poster and self.loop and self.loop.is_running():
-            asyncio.run_coroutine_threadsafe(self.poster.close(force=True), self.loop)
+        # 投递退出标记，唤醒正在等待任务的主循环；
+        # 浏览器由 run() 的 finally 在事件循环内关闭，避免与循环关闭产生竞争
+        self.enqueue_action(None)
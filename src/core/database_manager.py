@@ -7,6 +7,7 @@
 import os
 import sqlite3
 import shutil
+import threading
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 from datetime import datetime
@@ -25,6 +26,10 @@ class DatabaseManager:
         # 备份目录
         self.backup_dir = os.path.join(self.app_config_dir, 'backups')
         
+        # 后台初始化完成标记（未开始后台初始化时不阻塞）
+        self._ready_event = threading.Event()
+        self._ready_event.set()
+
         # 确保目录存在
         self._ensure_directories()
     
@@ -503,6 +508,22 @@ class DatabaseManager:
         
         return info
     
+    def mark_initializing(self):
+        """标记数据库即将在后台初始化，之后 wait_ready() 会阻塞到初始化结束"""
+        self._ready_event.clear()
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """
+        等待后台初始化结束
+        
+        Args:
+            timeout: 最长等待秒数，None 表示一直等待
+            
+        Returns:
+            bool: 是否已结束（超时返回 False）
+        """
+        return self._ready_event.wait(timeout)
+
     def ensure_database_ready(self) -> bool:
         """
         确保数据库已准备就绪
@@ -511,6 +532,12 @@ class DatabaseManager:
         Returns:
             bool: 数据库是否就绪
         """
+        try:
+            return self._ensure_database_ready()
+        finally:
+            self._ready_event.set()
+
+    def _ensure_database_ready(self) -> bool:
         print("🔍 检查数据库状态...")
         
         # 检查数据库健康状态
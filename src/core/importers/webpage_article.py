@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import heapq
 import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 from html.parser import HTMLParser
 from typing import Dict, List, Optional, Tuple
 from urllib.parse import urljoin, urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 @dataclass
@@ -48,6 +52,23 @@ def _default_headers(*, referer: str = "") -> Dict[str, str]:
     return headers
 
 
+def _new_session() -> requests.Session:
+    # Shared session: keep-alive connections (and TLS sessions) are reused
+    # across imports instead of a fresh handshake per requests.get call.
+    session = requests.Session()
+    session.headers.update(_default_headers())
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=Retry(total=2, backoff_factor=0.2))
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_SESSION = _new_session()
+
+
+# Pages repeat the same assets (and one base URL serves every image on a
+# page), so the urljoin work is memoized per (raw, base_url).
+@lru_cache(maxsize=1024)
 def _normalize_url(raw: str, *, base_url: str = "") -> str:
     s = str(raw or "").strip()
     if not s:
@@ -76,102 +97,97 @@ def _normalize_url(raw: str, *, base_url: str = "") -> str:
 
 
 def _dedupe_keep_order(items: List[str]) -> List[str]:
-    out: List[str] = []
-    seen = set()
-    for it in items:
-        it = str(it or "").strip()
-        if not it:
-            continue
-        if it in seen:
-            continue
-        seen.add(it)
-        out.append(it)
-    return out
+    # dict preserves insertion order, so fromkeys dedupes in C.
+    return list(dict.fromkeys(s for s in (str(it or "").strip() for it in items) if s))
+
+
+# Patterns used by _cleanup_text, compiled once at import time.
+# Non-breaking spaces are folded into the same run, saving a separate replace.
+_RE_SPACES = re.compile(r"[ \t\f\v\xa0]+")
+# After _RE_SPACES every horizontal run is a single space, so trimming both
+# sides of a newline fits in one pass.
+_RE_SPACES_AROUND_NEWLINE = re.compile(r" ?\n ?")
+_RE_BLANK_LINES = re.compile(r"\n{3,}")
 
 
 def _cleanup_text(text: str) -> str:
     s = str(text or "")
     s = s.replace("\r\n", "\n").replace("\r", "\n")
-    s = s.replace("\xa0", " ")
-    s = re.sub(r"[ \t\f\v]+", " ", s)
-    s = re.sub(r"[ \t]+\n", "\n", s)
-    s = re.sub(r"\n[ \t]+", "\n", s)
-    s = re.sub(r"\n{3,}", "\n\n", s)
+    s = _RE_SPACES.sub(" ", s)
+    s = _RE_SPACES_AROUND_NEWLINE.sub("\n", s)
+    s = _RE_BLANK_LINES.sub("\n\n", s)
     return s.strip()
 
 
-class _MetaAndTitleParser(HTMLParser):
-    def __init__(self):
-        super().__init__(convert_charrefs=True)
-        self.meta: Dict[str, str] = {}
-        self.base_href: str = ""
-        self.canonical: str = ""
-
-        self._in_title = False
-        self.title_parts: List[str] = []
-
-        self._in_h1 = False
-        self.h1_parts: List[str] = []
-
-    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
-        t = tag.lower()
-        attrs_map = {str(k).lower(): (v or "") for k, v in attrs}
-
-        if t == "base":
-            href = (attrs_map.get("href") or "").strip()
-            if href and not self.base_href:
-                self.base_href = href
-            return
-
-        if t == "link":
-            rel = (attrs_map.get("rel") or "").lower()
-            href = (attrs_map.get("href") or "").strip()
-            if href and "canonical" in rel and not self.canonical:
-                self.canonical = href
-            return
-
-        if t == "meta":
-            key = (attrs_map.get("property") or attrs_map.get("name") or "").strip()
-            content = (attrs_map.get("content") or "").strip()
-            if key and content:
-                self.meta[key.lower()] = content
-            return
-
-        if t == "title":
-            self._in_title = True
-            return
+def _attrs_map(attrs: List[Tuple[str, Optional[str]]]) -> Dict[str, str]:
+    # Built lazily by the parsers, only for tags whose attributes are read.
+    return {str(k).lower(): (v or "") for k, v in attrs}
 
-        if t == "h1":
-            self._in_h1 = True
 
-    def handle_endtag(self, tag: str) -> None:
-        t = tag.lower()
-        if t == "title" and self._in_title:
-            self._in_title = False
-        if t == "h1" and self._in_h1:
-            self._in_h1 = False
-
-    def handle_data(self, data: str) -> None:
-        if self._in_title:
-            self.title_parts.append(data)
-        if self._in_h1:
-            self.h1_parts.append(data)
-
-
-@dataclass
 class _Container:
-    tag: str
-    start_depth: int
-    weight: int = 0
-    text_parts: List[str] = field(default_factory=list)
-    image_urls: List[str] = field(default_factory=list)
+    # One instance per container tag on the page; __slots__ keeps them small.
+    # (dataclass(slots=True) would need Python 3.10.)
+    __slots__ = (
+        "tag",
+        "start_depth",
+        "weight",
+        "texts",
+        "images",
+        "text_start",
+        "text_end",
+        "image_start",
+        "image_end",
+        "chars_start",
+        "raw_len",
+    )
+
+    def __init__(
+        self,
+        tag: str,
+        start_depth: int,
+        weight: int = 0,
+        *,
+        texts: Optional[List[str]] = None,
+        images: Optional[List[str]] = None,
+        text_start: int = 0,
+        image_start: int = 0,
+        chars_start: int = 0,
+    ) -> None:
+        self.tag = tag
+        self.start_depth = start_depth
+        self.weight = weight
+        # Every open container sees the same stream of text/images, so they
+        # all share the parser's buffers and only remember their span in
+        # them. The end stays None while the container is still open.
+        self.texts: List[str] = texts if texts is not None else []
+        self.images: List[str] = images if images is not None else []
+        self.text_start = text_start
+        self.text_end: Optional[int] = None
+        self.image_start = image_start
+        self.image_end: Optional[int] = None
+        # Raw (uncleaned) character count, known once the container closes.
+        self.chars_start = chars_start
+        self.raw_len = 0
+
+    @property
+    def text_parts(self) -> List[str]:
+        return self.texts[self.text_start : self.text_end]
+
+    @property
+    def image_urls(self) -> List[str]:
+        return self.images[self.image_start : self.image_end]
+
+    def close(self, chars_end: int) -> None:
+        self.text_end = len(self.texts)
+        self.image_end = len(self.images)
+        self.raw_len = chars_end - self.chars_start
 
     def finalize_text(self) -> str:
         return _cleanup_text("".join(self.text_parts))
 
 
 class _GenericContentParser(HTMLParser):
-    _BLOCK_TAGS = {
+    _BLOCK_TAGS = frozenset({
         "p",
         "div",
         "section",
@@ -188,9 +204,9 @@ class _GenericContentParser(HTMLParser):
         "li",
         "blockquote",
         "pre",
-    }
-    _SKIP_TAGS = {"script", "style", "noscript"}
-    _VOID_TAGS = {
+    })
+    _SKIP_TAGS = frozenset({"script", "style", "noscript"})
+    _VOID_TAGS = frozenset({
         "area",
         "base",
         "br",
@@ -205,10 +221,10 @@ class _GenericContentParser(HTMLParser):
         "source",
         "track",
         "wbr",
-    }
-    _CONTAINER_TAGS = {"article", "main", "section", "div"}
+    })
+    _CONTAINER_TAGS = frozenset({"article", "main", "section", "div"})
 
-    _POSITIVE_HINTS = {
+    _POSITIVE_HINTS = frozenset({
         "content",
         "article",
         "post",
@@ -221,8 +237,8 @@ class _GenericContentParser(HTMLParser):
         "markdown",
         "story",
         "news",
-    }
-    _NEGATIVE_HINTS = {
+    })
+    _NEGATIVE_HINTS = frozenset({
         "nav",
         "footer",
         "header",
@@ -239,14 +255,28 @@ class _GenericContentParser(HTMLParser):
         "toolbar",
         "menu",
         "pagination",
-    }
+    })
 
     def __init__(self):
         super().__init__(convert_charrefs=True)
+        # Head metadata and title candidates, collected in the same pass.
+        self.meta: Dict[str, str] = {}
+        self.base_href: str = ""
+        self.canonical: str = ""
+
+        self._in_title = False
+        self.title_parts: List[str] = []
+
+        self._in_h1 = False
+        self.h1_parts: List[str] = []
+
         self.depth = 0
         self._skip_depth = 0
 
-        self.root = _Container(tag="__root__", start_depth=0, weight=0)
+        self._texts: List[str] = []
+        self._images: List[str] = []
+        self._chars = 0
+        self.root = self._new_container("__root__", 0, 0)
         self._open: List[_Container] = [self.root]
         self.closed: List[_Container] = []
 
@@ -267,26 +297,66 @@ class _GenericContentParser(HTMLParser):
             ]
         ).lower()
 
-        pos_hits = sum(1 for k in self._POSITIVE_HINTS if k in hint)
-        neg_hits = sum(1 for k in self._NEGATIVE_HINTS if k in hint)
+        return weight + _hint_weight(hint)
 
-        weight += pos_hits * 3
-        weight -= neg_hits * 5
-        return weight
+    def _new_container(self, tag: str, start_depth: int, weight: int) -> _Container:
+        return _Container(
+            tag=tag,
+            start_depth=start_depth,
+            weight=weight,
+            texts=self._texts,
+            images=self._images,
+            text_start=len(self._texts),
+            image_start=len(self._images),
+            chars_start=self._chars,
+        )
+
+    def finish(self) -> None:
+        """Close the root container once the whole document has been fed."""
+        self.root.close(self._chars)
 
     def _append_to_open(self, s: str) -> None:
-        for c in self._open:
-            c.text_parts.append(s)
+        self._texts.append(s)
+        self._chars += len(s)
 
     def _append_img_to_open(self, u: str) -> None:
-        for c in self._open:
-            c.image_urls.append(u)
+        self._images.append(u)
+
+    def _handle_head_tag(self, t: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        # Only these head tags need their attributes.
+        attrs_map = _attrs_map(attrs)
+
+        if t == "base":
+            href = (attrs_map.get("href") or "").strip()
+            if href and not self.base_href:
+                self.base_href = href
+            return
+
+        if t == "link":
+            rel = (attrs_map.get("rel") or "").lower()
+            href = (attrs_map.get("href") or "").strip()
+            if href and "canonical" in rel and not self.canonical:
+                self.canonical = href
+            return
+
+        key = (attrs_map.get("property") or attrs_map.get("name") or "").strip()
+        content = (attrs_map.get("content") or "").strip()
+        if key and content:
+            self.meta[key.lower()] = content
 
     def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
         t = tag.lower()
+
+        # Metadata and title/h1 tracking are independent of _skip_depth.
+        if t == "title":
+            self._in_title = True
+        elif t == "h1":
+            self._in_h1 = True
+        elif t in ("base", "link", "meta"):
+            self._handle_head_tag(t, attrs)
+
         if t not in self._VOID_TAGS:
             self.depth += 1
-        attrs_map = {str(k).lower(): (v or "") for k, v in attrs}
 
         if t in self._SKIP_TAGS:
             self._skip_depth += 1
@@ -299,6 +369,7 @@ class _GenericContentParser(HTMLParser):
             self._append_to_open("\n")
 
         if t == "img":
+            attrs_map = _attrs_map(attrs)
             raw = (
                 (attrs_map.get("data-src") or "")
                 or (attrs_map.get("data-original") or "")
@@ -311,11 +382,15 @@ class _GenericContentParser(HTMLParser):
                 self._append_img_to_open(raw)
 
         if t in self._CONTAINER_TAGS:
-            weight = self._calc_weight(t, attrs_map)
-            self._open.append(_Container(tag=t, start_depth=self.depth, weight=weight))
+            weight = self._calc_weight(t, _attrs_map(attrs))
+            self._open.append(self._new_container(t, self.depth, weight))
 
     def handle_endtag(self, tag: str) -> None:
         t = tag.lower()
+        if t == "title" and self._in_title:
+            self._in_title = False
+        if t == "h1" and self._in_h1:
+            self._in_h1 = False
 
         # Void elements don't have a real end tag in HTML. HTMLParser may call
         # handle_endtag for XHTML-style <img/>; keep depth unchanged.
@@ -336,34 +411,53 @@ class _GenericContentParser(HTMLParser):
             and self._open[-1].tag == t
             and self._open[-1].start_depth == self.depth
         ):
-            self.closed.append(self._open.pop())
+            c = self._open.pop()
+            c.close(self._chars)
+            self.closed.append(c)
 
         self.depth = max(0, self.depth - 1)
 
     def handle_data(self, data: str) -> None:
+        if self._in_title:
+            self.title_parts.append(data)
+        if self._in_h1:
+            self.h1_parts.append(data)
+
         if self._skip_depth > 0:
             return
         if data:
             self._append_to_open(data)
 
 
+@lru_cache(maxsize=1024)
+def _hint_weight(hint: str) -> int:
+    # id/class strings repeat heavily within a page (and across pages of one
+    # site), so the 28 substring checks run once per distinct hint.
+    pos_hits = sum(1 for k in _GenericContentParser._POSITIVE_HINTS if k in hint)
+    neg_hits = sum(1 for k in _GenericContentParser._NEGATIVE_HINTS if k in hint)
+    return pos_hits * 3 - neg_hits * 5
+
+
 def parse_webpage_html(html: str, *, base_url: str = "") -> Dict[str, object]:
     s = str(html or "")
 
-    meta_parser = _MetaAndTitleParser()
+    # A single tokenization collects both the head metadata and the
+    # container tree.
+    parser = _GenericContentParser()
     try:
-        meta_parser.feed(s)
+        parser.feed(s)
     except Exception:
         pass
+    parser.finish()
 
     resolved_base = str(base_url or "").strip()
-    if meta_parser.base_href:
-        resolved_base = urljoin(resolved_base or base_url or "", meta_parser.base_href)
-    elif meta_parser.canonical and resolved_base:
+    if parser.base_href:
+        resolved_base = urljoin(resolved_base or base_url or "", parser.base_href)
+    elif parser.canonical and resolved_base:
         # Canonical can help for relative image URLs
-        resolved_base = urljoin(resolved_base, meta_parser.canonical)
+        resolved_base = urljoin(resolved_base, parser.canonical)
 
-    meta = meta_parser.meta
+    meta = parser.meta
 
     title = (
         (meta.get("og:title") or "").strip()
@@ -371,11 +465,11 @@ def parse_webpage_html(html: str, *, base_url: str = "") -> Dict[str, object]:
         or (meta.get("title") or "").strip()
     )
     if not title:
-        h1 = _cleanup_text("".join(meta_parser.h1_parts))
+        h1 = _cleanup_text("".join(parser.h1_parts))
         if h1:
             title = h1
         else:
-            title = _cleanup_text("".join(meta_parser.title_parts))
+            title = _cleanup_text("".join(parser.title_parts))
 
     cover = (
         (meta.get("og:image") or "").strip()
@@ -396,40 +490,55 @@ def parse_webpage_html(html: str, *, base_url: str = "") -> Dict[str, object]:
         or (meta.get("date") or "").strip()
     )
 
-    content_parser = _GenericContentParser()
-    try:
-        content_parser.feed(s)
-    except Exception:
-        pass
+    containers = list(parser.closed) + [parser.root]
 
-    containers = list(content_parser.closed) + [content_parser.root]
+    # Score: text length dominates, but hint-weight can flip close calls.
+    # Cleaning only ever shortens text, so raw length + weight bonus bounds
+    # the score from above. Visit containers by that bound and stop once no
+    # remaining one can beat (or tie with) the best, so only a handful are
+    # cleaned. Ties go to the earlier container, as in document order.
+    # A heap instead of a full sort: usually only the first few are popped.
+    pending = [(-(c.raw_len + c.weight * 200), i) for i, c in enumerate(containers)]
+    heapq.heapify(pending)
 
-    best = content_parser.root
+    best_index = -1
     best_score = -1
-    for c in containers:
+    content_text = ""
+    while pending:
+        neg_bound, i = heapq.heappop(pending)
+        if -neg_bound < best_score:
+            break
+        c = containers[i]
         text = c.finalize_text()
         if not text:
             continue
-        # Score: text length dominates, but hint-weight can flip close calls.
         score = len(text) + (c.weight * 200)
-        if score > best_score:
+        if score > best_score or (score == best_score and 0 <= i < best_index):
+            best_index = i
             best_score = score
-            best = c
+            content_text = text
 
-    content_text = best.finalize_text()
+    if best_index < 0:
+        best = parser.root
+        content_text = best.finalize_text()
+    else:
+        best = containers[best_index]
     raw_images = list(best.image_urls or [])
 
-    image_urls = [_normalize_url(u, base_url=resolved_base or base_url or "") for u in raw_images]
+    join_base = resolved_base or base_url or ""
+    # Identical raw URLs normalize identically; only join each one once.
+    image_urls = [_normalize_url(u, base_url=join_base) for u in dict.fromkeys(raw_images)]
     image_urls = [u for u in image_urls if u]
     image_urls = _dedupe_keep_order(image_urls)
 
-    cover_url = _normalize_url(cover, base_url=resolved_base or base_url or "")
+    cover_url = _normalize_url(cover, base_url=join_base)
     if not cover_url and image_urls:
         cover_url = image_urls[0]
 
-    # Avoid duplicating cover in content images
-    if cover_url:
-        image_urls = [u for u in image_urls if u != cover_url]
+    # Avoid duplicating cover in content images (already deduped, so at
+    # most one entry to drop).
+    if cover_url in image_urls:
+        image_urls.remove(cover_url)
 
     return {
         "title": title,
@@ -442,6 +551,36 @@ def parse_webpage_html(html: str, *, base_url: str = "") -> Dict[str, object]:
     }
 
 
+def _decode_body(resp: requests.Response) -> str:
+    """Decode the response body once.
+
+    The charset from Content-Type is used when present. Otherwise UTF-8 and
+    GB18030 are tried strictly before falling back to requests' charset
+    detection, which scans the whole body and is slow on large pages.
+    """
+    body = resp.content or b""
+    if resp.encoding:
+        try:
+            return body.decode(resp.encoding, errors="replace")
+        except LookupError:
+            pass
+
+    for encoding in ("utf-8", "gb18030"):
+        try:
+            return body.decode(encoding)
+        except UnicodeDecodeError:
+            continue
+
+    try:
+        encoding = resp.apparent_encoding or "utf-8"
+    except Exception:
+        encoding = "utf-8"
+    try:
+        return body.decode(encoding, errors="replace")
+    except LookupError:
+        return body.decode("utf-8", errors="replace")
+
+
 def fetch_webpage_article(url: str, *, timeout_s: int = 25) -> WebpageArticle:
     target_url = str(url or "").strip()
     if not target_url:
@@ -449,21 +588,14 @@ def fetch_webpage_article(url: str, *, timeout_s: int = 25) -> WebpageArticle:
     if not is_http_url(target_url):
         raise ValueError("仅支持 http/https 网页链接")
 
-    resp = requests.get(
+    resp = _SESSION.get(
         target_url,
-        headers=_default_headers(),
         timeout=max(5, int(timeout_s or 0)),
         allow_redirects=True,
     )
     resp.raise_for_status()
 
-    if not resp.encoding:
-        try:
-            resp.encoding = resp.apparent_encoding or "utf-8"
-        except Exception:
-            resp.encoding = "utf-8"
-
-    html = resp.text or ""
+    html = _decode_body(resp)
     parsed = parse_webpage_html(html, base_url=resp.url or target_url)
 
     return WebpageArticle(
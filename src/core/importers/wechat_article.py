@@ -6,6 +6,8 @@ from html.parser import HTMLParser
 from typing import Dict, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 @dataclass
@@ -43,6 +45,20 @@ def _default_headers(*, referer: str = "") -> Dict[str, str]:
     return headers
 
 
+def _new_session() -> requests.Session:
+    # Shared session: keep-alive connections (and TLS sessions) are reused
+    # across imports instead of a fresh handshake per requests.get call.
+    session = requests.Session()
+    session.headers.update(_default_headers())
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=Retry(total=2, backoff_factor=0.2))
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_SESSION = _new_session()
+
+
 def _normalize_image_url(raw: str) -> str:
     s = str(raw or "").strip()
     if not s:
@@ -55,52 +71,69 @@ def _normalize_image_url(raw: str) -> str:
 
 
 def _dedupe_keep_order(items: List[str]) -> List[str]:
-    out: List[str] = []
-    seen = set()
-    for it in items:
-        it = str(it or "").strip()
-        if not it:
-            continue
-        if it in seen:
-            continue
-        seen.add(it)
-        out.append(it)
-    return out
+    # dict preserves insertion order, so fromkeys dedupes in C.
+    return list(dict.fromkeys(s for s in (str(it or "").strip() for it in items) if s))
+
+
+# Patterns used by _cleanup_text, compiled once at import time.
+# Non-breaking spaces are folded into the same run, saving a separate replace.
+_RE_SPACES = re.compile(r"[ \t\f\v\xa0]+")
+# After _RE_SPACES every horizontal run is a single space, so trimming both
+# sides of a newline fits in one pass.
+_RE_SPACES_AROUND_NEWLINE = re.compile(r" ?\n ?")
+_RE_BLANK_LINES = re.compile(r"\n{3,}")
 
 
 def _cleanup_text(text: str) -> str:
     s = str(text or "")
     s = s.replace("\r\n", "\n").replace("\r", "\n")
-    # Remove non-breaking spaces
-    s = s.replace("\xa0", " ")
-    # Collapse whitespace but keep newlines.
-    s = re.sub(r"[ \t\f\v]+", " ", s)
+    # Collapse whitespace (including non-breaking spaces) but keep newlines.
+    s = _RE_SPACES.sub(" ", s)
     # Trim spaces around newlines
-    s = re.sub(r"[ \t]+\n", "\n", s)
-    s = re.sub(r"\n[ \t]+", "\n", s)
+    s = _RE_SPACES_AROUND_NEWLINE.sub("\n", s)
     # Collapse excessive blank lines
-    s = re.sub(r"\n{3,}", "\n\n", s)
+    s = _RE_BLANK_LINES.sub("\n\n", s)
     return s.strip()
 
 
+# Start of the article body container; everything before it (head, inline
+# scripts) is irrelevant to the content parser.
+_JS_CONTENT_START = re.compile(
+    r"""<div\b[^>]*?\sid\s*=\s*(?:"js_content"|'js_content'|js_content(?=[\s/>]))""",
+    re.IGNORECASE,
+)
+
+
+class _StopParsing(Exception):
+    """Raised by a parser once it has collected everything it needs."""
+
+
+_OG_META_KEYS = ("og:title", "og:image", "og:description", "og:site_name", "og:article:author")
+_RE_META_TAG = re.compile(r"<meta\b([^>]*)>", re.IGNORECASE)
+_RE_META_ATTR = re.compile(
+    r"""(?:^|\s)(property|content)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))""",
+    re.IGNORECASE,
+)
+
+
 def _extract_og_meta(html: str) -> Dict[str, str]:
     """Extract a few og:* meta tags without additional dependencies."""
     s = str(html or "")
-    out: Dict[str, str] = {}
+    found: Dict[str, str] = {}
 
-    def _pick(prop: str) -> str:
-        m = re.search(
-            rf'<meta[^>]+property=["\']{re.escape(prop)}["\'][^>]+content=["\']([^"\']+)["\']',
-            s,
-            re.IGNORECASE,
-        )
-        return (m.group(1) if m else "").strip()
+    # One scan over the <meta> tags (attributes in any order); the first tag
+    # wins for each property, and scanning stops once every key is seen.
+    for m in _RE_META_TAG.finditer(s):
+        attrs: Dict[str, str] = {}
+        for a in _RE_META_ATTR.finditer(m.group(1)):
+            attrs.setdefault(a.group(1).lower(), a.group(2) or a.group(3) or a.group(4) or "")
+        key = attrs.get("property", "").strip().lower()
+        if key in _OG_META_KEYS and key not in found and "content" in attrs:
+            found[key] = attrs["content"].strip()
+            if len(found) == len(_OG_META_KEYS):
+                break
 
-    for k in ("og:title", "og:image", "og:description", "og:site_name", "og:article:author"):
-        v = _pick(k)
-        if v:
-            out[k] = v
-    return out
+    return {k: found[k] for k in _OG_META_KEYS if found.get(k)}
 
 
 class _WechatTitleParser(HTMLParser):
@@ -112,15 +145,17 @@ class _WechatTitleParser(HTMLParser):
         self.fallback_title_parts: List[str] = []
 
     def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
-        attrs_map = {k: (v or "") for k, v in attrs}
-        if tag.lower() == "h1" and attrs_map.get("id") == "activity-name":
+        t = tag.lower()
+        if t == "h1" and dict(attrs).get("id") == "activity-name":
             self._in_activity_name = True
-        if tag.lower() == "title":
+        elif t == "title":
             self._in_title_tag = True
 
     def handle_endtag(self, tag: str) -> None:
         if tag.lower() == "h1" and self._in_activity_name:
             self._in_activity_name = False
+            # <title> lives in <head>, so nothing after the article title matters.
+            raise _StopParsing()
         if tag.lower() == "title" and self._in_title_tag:
             self._in_title_tag = False
 
@@ -132,7 +167,7 @@ class _WechatTitleParser(HTMLParser):
 
 
 class _WechatContentParser(HTMLParser):
-    _BLOCK_TAGS = {
+    _BLOCK_TAGS = frozenset({
         "p",
         "div",
         "section",
@@ -147,29 +182,47 @@ class _WechatContentParser(HTMLParser):
         "ol",
         "li",
         "blockquote",
-    }
-    _SKIP_TAGS = {"script", "style"}
+    })
+    _SKIP_TAGS = frozenset({"script", "style"})
+    # Tags that never get an end tag in HTML; they must not be pushed.
+    _VOID_TAGS = frozenset({
+        "area",
+        "base",
+        "br",
+        "col",
+        "embed",
+        "hr",
+        "img",
+        "input",
+        "link",
+        "meta",
+        "param",
+        "source",
+        "track",
+        "wbr",
+    })
 
     def __init__(self):
         super().__init__(convert_charrefs=True)
         self._in_content = False
-        self._depth = 0
+        # Open tags inside js_content; js_content itself is the bottom entry.
+        self._stack: List[str] = []
         self._skip_depth = 0
         self.text_parts: List[str] = []
         self.image_urls: List[str] = []
 
     def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
         t = tag.lower()
-        attrs_map = {k: (v or "") for k, v in attrs}
 
         if not self._in_content:
-            if t == "div" and attrs_map.get("id") == "js_content":
+            if t == "div" and dict(attrs).get("id") == "js_content":
                 self._in_content = True
-                self._depth = 1
+                self._stack.append(t)
             return
 
         # Nested tag inside js_content
-        self._depth += 1
+        if t not in self._VOID_TAGS:
+            self._stack.append(t)
 
         if t in self._SKIP_TAGS:
             self._skip_depth += 1
@@ -179,6 +232,7 @@ class _WechatContentParser(HTMLParser):
             return
 
         if t == "img":
+            attrs_map = {k: (v or "") for k, v in attrs}
             src = (attrs_map.get("data-src") or attrs_map.get("src") or "").strip()
             if src:
                 self.image_urls.append(src)
@@ -199,9 +253,15 @@ class _WechatContentParser(HTMLParser):
         if self._skip_depth == 0 and t in self._BLOCK_TAGS:
             self.text_parts.append("\n")
 
-        self._depth -= 1
-        if self._depth <= 0:
+        # Pop up to the matching open tag (implicitly closing unclosed
+        # children); stray end tags are ignored.
+        if t in self._VOID_TAGS or t not in self._stack:
+            return
+        while self._stack.pop() != t:
+            pass
+        if not self._stack:
             self._in_content = False
+            raise _StopParsing()
 
     def handle_data(self, data: str) -> None:
         if not self._in_content:
@@ -219,9 +279,8 @@ def fetch_wechat_article(url: str, *, timeout_s: int = 25) -> WechatArticle:
     if not is_wechat_mp_article_url(target_url):
         raise ValueError("仅支持 mp.weixin.qq.com 的公众号文章链接（/s 或 /s?）")
 
-    resp = requests.get(
+    resp = _SESSION.get(
         target_url,
-        headers=_default_headers(),
         timeout=max(5, int(timeout_s or 0)),
         allow_redirects=True,
     )
@@ -238,13 +297,21 @@ def fetch_wechat_article(url: str, *, timeout_s: int = 25) -> WechatArticle:
     title = (meta.get("og:title") or "").strip()
     if not title:
         tp = _WechatTitleParser()
-        tp.feed(html)
+        try:
+            tp.feed(html)
+        except _StopParsing:
+            pass
         title = _cleanup_text("".join(tp.title_parts))
         if not title:
             title = _cleanup_text("".join(tp.fallback_title_parts))
 
+    # Only tokenize from js_content onwards, and stop once it is closed.
+    m = _JS_CONTENT_START.search(html)
     cp = _WechatContentParser()
-    cp.feed(html)
+    try:
+        cp.feed(html[m.start():] if m else html)
+    except _StopParsing:
+        pass
 
     content_text = _cleanup_text("".join(cp.text_parts))
     image_urls = [_normalize_image_url(u) for u in cp.image_urls]
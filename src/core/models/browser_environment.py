@@ -92,6 +92,7 @@ class BrowserEnvironment(Base):
             
             # 指纹信息
             'user_agent': self.user_agent,
+            'browser_display': self.get_browser_display(),
             'viewport_width': self.viewport_width,
             'viewport_height': self.viewport_height,
             'screen_width': self.screen_width,
@@ -122,6 +123,15 @@ class BrowserEnvironment(Base):
             return "直连"
         
         return f"{self.proxy_type}://{self.proxy_host}:{self.proxy_port}"
+    
+    def get_browser_display(self):
+        """获取浏览器显示文本（由 User-Agent 推断）"""
+        ua = self.user_agent or ""
+        if "Chrome" in ua:
+            return "Chrome"
+        if "Firefox" in ua:
+            return "Firefox"
+        return "Unknown"
     
     def get_proxy_url(self):
         """获取代理URL"""
@@ -4,14 +4,32 @@
 """
 
 import json
-from PyQt5.QtCore import Qt, pyqtSignal
-from PyQt5.QtGui import QFont
+import random
+import time
+from PyQt5.QtCore import QAbstractTableModel, QEvent, QModelIndex, QRect, Qt, pyqtSignal
+from PyQt5.QtGui import QFont, QFontMetrics
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-                             QPushButton, QTableWidget, QTableWidgetItem, 
+                             QPushButton, QTableView, QStyledItemDelegate,
+                             QStyle, QStyleOptionButton, QApplication,
                              QDialog, QTextEdit, QMessageBox, QTabWidget,
                              QCheckBox, QComboBox, QSpinBox, QLineEdit)
 
-from src.core.ui.qt_font import get_mono_font_family, get_ui_font_family
+from src.core.ui.qt_font import shared_font
+
+# orjson 为可选依赖：已安装时用于加速表单 → JSON 的序列化
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, indent=2)
+
+
+def _dumps_pretty(obj):
+    """序列化为带两格缩进的 JSON 文本（与 json.dumps(..., indent=2) 格式一致）"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return _JSON_ENCODER.encode(obj)
 
 # 导入服务类
 try:
@@ -27,29 +45,96 @@ except ImportError as e:
     # Mock服务类
     class MockBrowserEnvironmentService:
         def __init__(self):
-            self.data = []
+            # 按 id 索引（dict 保持插入顺序），更新/删除不必线性扫描
+            self._by_id = {}
+            self._next_id = 1
         
         def get_all(self, user_id=None):
-            return [{'id': item.get('id'), **item} for item in self.data if isinstance(item, dict)]
+            # 记录只由 create 写入，必然是 dict，无需逐条检查类型
+            return [{'id': item.get('id'), **item} for item in self._by_id.values()]
         
         def create(self, **kwargs):
             item = kwargs.copy()
-            item['id'] = len(self.data) + 1
-            self.data.append(item)
+            item['id'] = self._next_id
+            self._next_id += 1
+            self._by_id[item['id']] = item
             return item
         
         def update(self, item_id, **kwargs):
-            for item in self.data:
-                if isinstance(item, dict) and item.get('id') == item_id:
-                    item.update(kwargs)
-                    return item
-            return None
+            item = self._by_id.get(item_id)
+            if item is None:
+                return None
+            item.update(kwargs)
+            return item
         
         def delete(self, item_id):
-            self.data = [item for item in self.data if not (isinstance(item, dict) and item.get('id') == item_id)]
+            self._by_id.pop(item_id, None)
             return True
 
     browser_environment_service = MockBrowserEnvironmentService()
+
+# 当前用户服务：模块加载时导入一次，Mock 模式下不会用到
+try:
+    from ..services.user_service import user_service as _user_service
+except ImportError:
+    _user_service = None
+
+
+# 表单下拉选项
+_PROXY_TYPES = ("direct", "http", "https", "socks5")
+_PLATFORMS = ("Win32", "MacIntel", "Linux x86_64", "iPhone", "Android")
+_TIMEZONES = ("Asia/Shanghai", "Asia/Beijing", "Asia/Hong_Kong", "UTC")
+
+# 预设环境配置
+_PRESETS = {
+    "Windows Chrome": {
+        "name": "Windows Chrome环境",
+        "proxy_enabled": False,
+        "proxy_type": "direct",
+        "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        "viewport_width": 1920,
+        "viewport_height": 937,
+        "platform": "Win32",
+        "timezone": "Asia/Shanghai",
+        "webgl_vendor": "Google Inc. (Intel)",
+        "webgl_renderer": "ANGLE (Intel, Intel(R) HD Graphics Direct3D11)"
+    },
+    "Mac Chrome": {
+        "name": "Mac Chrome环境", 
+        "proxy_enabled": False,
+        "proxy_type": "direct",
+        "user_agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        "viewport_width": 1440,
+        "viewport_height": 764,
+        "platform": "MacIntel",
+        "timezone": "Asia/Shanghai",
+        "webgl_vendor": "Apple Inc.",
+        "webgl_renderer": "Apple GPU"
+    },
+    "SOCKS5代理": {
+        "name": "SOCKS5代理环境",
+        "proxy_enabled": True,
+        "proxy_type": "socks5",
+        "proxy_host": "127.0.0.1",
+        "proxy_port": 1080,
+        "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        "viewport_width": 1366,
+        "viewport_height": 625,
+        "platform": "Win32",
+        "timezone": "Asia/Shanghai"
+    }
+}
+
+# 随机生成配置时的候选值
+_UA_POOL = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/121.0",
+)
+_RESOLUTION_POOL = ((1920, 1080), (1366, 768), (1440, 900))
+_PLATFORM_POOL = ("Win32", "MacIntel")
+_PROXY_TYPE_POOL = ("direct", "socks5", "http")
+_PROXY_PORT_POOL = (1080, 8080, 3128)
 
 
 class BrowserEnvironmentDialog(QDialog):
@@ -62,7 +147,7 @@ class BrowserEnvironmentDialog(QDialog):
         self.setFixedSize(1100, 750)  # 进一步增大对话框尺寸，更宽敞
         
         # 设置全局字体
-        self.default_font = QFont(get_ui_font_family(), 12)  # 增大字体到12号
+        self.default_font = shared_font(12)  # 增大字体到12号
         self.setFont(self.default_font)
         
         self.init_ui()
@@ -73,7 +158,7 @@ class BrowserEnvironmentDialog(QDialog):
         layout.setSpacing(15)
         
         title_label = QLabel("🌐 浏览器环境配置")
-        title_label.setFont(QFont(get_ui_font_family(), 18, QFont.Bold))  # 标题更大字体
+        title_label.setFont(shared_font(18, QFont.Bold))  # 标题更大字体
         title_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(title_label)
         
@@ -85,15 +170,16 @@ class BrowserEnvironmentDialog(QDialog):
         self.init_basic_tab()
         self.tab_widget.addTab(self.basic_tab, "🔧 基本配置")
         
-        # 高级配置选项卡  
+        # 高级配置和JSON配置选项卡：大多数情况下只改基本配置，
+        # 这两页的控件等首次切换过去时再构建
         self.advanced_tab = QWidget()
-        self.init_advanced_tab()
+        self._advanced_built = False
         self.tab_widget.addTab(self.advanced_tab, "⚡ 高级配置")
         
-        # JSON配置选项卡
         self.json_tab = QWidget()
-        self.init_json_tab()
+        self._json_built = False
         self.tab_widget.addTab(self.json_tab, "📝 JSON配置")
+        self.tab_widget.currentChanged.connect(self._on_tab_changed)
         
         layout.addWidget(self.tab_widget)
         
@@ -101,14 +187,14 @@ class BrowserEnvironmentDialog(QDialog):
         button_layout = QHBoxLayout()
         
         preset_btn = QPushButton("📋 加载预设")
-        preset_btn.setFont(QFont(get_ui_font_family(), 12))  # 按钮字体
+        preset_btn.setFont(shared_font(12))  # 按钮字体
         preset_btn.setMinimumHeight(35)
         preset_btn.setMinimumWidth(100)  # 增加按钮宽度
         preset_btn.clicked.connect(self.load_preset)
         button_layout.addWidget(preset_btn)
         
         random_btn = QPushButton("🎲 随机生成")
-        random_btn.setFont(QFont(get_ui_font_family(), 12))  # 按钮字体
+        random_btn.setFont(shared_font(12))  # 按钮字体
         random_btn.setMinimumHeight(35)
         random_btn.setMinimumWidth(100)
         random_btn.clicked.connect(self.generate_random)
@@ -117,14 +203,14 @@ class BrowserEnvironmentDialog(QDialog):
         button_layout.addStretch()
         
         cancel_btn = QPushButton("❌ 取消")  # 添加图标
-        cancel_btn.setFont(QFont(get_ui_font_family(), 12))  # 按钮字体
+        cancel_btn.setFont(shared_font(12))  # 按钮字体
         cancel_btn.setMinimumHeight(35)
         cancel_btn.setMinimumWidth(80)
         cancel_btn.clicked.connect(self.reject)
         button_layout.addWidget(cancel_btn)
         
         ok_btn = QPushButton("✅ 确定")  # 添加图标
-        ok_btn.setFont(QFont(get_ui_font_family(), 12))  # 按钮字体
+        ok_btn.setFont(shared_font(12))  # 按钮字体
         ok_btn.setMinimumHeight(35)
         ok_btn.setMinimumWidth(80)
         ok_btn.clicked.connect(self.accept)
@@ -153,7 +239,7 @@ class BrowserEnvironmentDialog(QDialog):
         proxy_config_layout = QHBoxLayout()
         proxy_config_layout.addWidget(QLabel("代理类型:"))
         self.proxy_type = QComboBox()
-        self.proxy_type.addItems(["direct", "http", "https", "socks5"])
+        self.proxy_type.addItems(_PROXY_TYPES)
         proxy_config_layout.addWidget(self.proxy_type)
         
         proxy_config_layout.addWidget(QLabel("主机:"))
@@ -209,17 +295,35 @@ class BrowserEnvironmentDialog(QDialog):
         platform_layout = QHBoxLayout()
         platform_layout.addWidget(QLabel("平台:"))
         self.platform = QComboBox()
-        self.platform.addItems(["Win32", "MacIntel", "Linux x86_64", "iPhone", "Android"])
+        self.platform.addItems(_PLATFORMS)
         platform_layout.addWidget(self.platform)
         
         platform_layout.addWidget(QLabel("时区:"))
         self.timezone = QComboBox()
-        self.timezone.addItems(["Asia/Shanghai", "Asia/Beijing", "Asia/Hong_Kong", "UTC"])
+        self.timezone.addItems(_TIMEZONES)
         platform_layout.addWidget(self.timezone)
         browser_group.addLayout(platform_layout)
         
         layout.addLayout(browser_group)
 
+    def _on_tab_changed(self, index):
+        """切换选项卡时按需构建高级/JSON配置页"""
+        tab = self.tab_widget.widget(index)
+        if tab is self.advanced_tab:
+            self._ensure_advanced_tab()
+        elif tab is self.json_tab:
+            self._ensure_json_tab()
+
+    def _ensure_advanced_tab(self):
+        if not self._advanced_built:
+            self._advanced_built = True
+            self.init_advanced_tab()
+
+    def _ensure_json_tab(self):
+        if not self._json_built:
+            self._json_built = True
+            self.init_json_tab()
+
     def init_advanced_tab(self):
         """初始化高级配置选项卡"""
         layout = QVBoxLayout(self.advanced_tab)
@@ -261,22 +365,22 @@ class BrowserEnvironmentDialog(QDialog):
         layout = QVBoxLayout(self.json_tab)
         
         info_label = QLabel("📝 您也可以直接编辑JSON配置:")
-        info_label.setFont(QFont(get_ui_font_family(), 12))
+        info_label.setFont(shared_font(12))
         layout.addWidget(info_label)
         
         self.json_edit = QTextEdit()
-        self.json_edit.setFont(QFont(get_mono_font_family(), 12))  # 增大JSON编辑器字体
+        self.json_edit.setFont(shared_font(12, mono=True))  # 增大JSON编辑器字体
         layout.addWidget(self.json_edit)
         
         sync_layout = QHBoxLayout()
         
         form_to_json_btn = QPushButton("表单 → JSON")
-        form_to_json_btn.setFont(QFont(get_ui_font_family(), 12))
+        form_to_json_btn.setFont(shared_font(12))
         form_to_json_btn.clicked.connect(self.form_to_json)
         sync_layout.addWidget(form_to_json_btn)
         
         json_to_form_btn = QPushButton("JSON → 表单")
-        json_to_form_btn.setFont(QFont(get_ui_font_family(), 12))
+        json_to_form_btn.setFont(shared_font(12))
         json_to_form_btn.clicked.connect(self.json_to_form)
         sync_layout.addWidget(json_to_form_btn)
         
@@ -285,74 +389,23 @@ class BrowserEnvironmentDialog(QDialog):
 
     def load_preset(self):
         """加载预设配置"""
-        presets = {
-            "Windows Chrome": {
-                "name": "Windows Chrome环境",
-                "proxy_enabled": False,
-                "proxy_type": "direct",
-                "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                "viewport_width": 1920,
-                "viewport_height": 937,
-                "platform": "Win32",
-                "timezone": "Asia/Shanghai",
-                "webgl_vendor": "Google Inc. (Intel)",
-                "webgl_renderer": "ANGLE (Intel, Intel(R) HD Graphics Direct3D11)"
-            },
-            "Mac Chrome": {
-                "name": "Mac Chrome环境", 
-                "proxy_enabled": False,
-                "proxy_type": "direct",
-                "user_agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                "viewport_width": 1440,
-                "viewport_height": 764,
-                "platform": "MacIntel",
-                "timezone": "Asia/Shanghai",
-                "webgl_vendor": "Apple Inc.",
-                "webgl_renderer": "Apple GPU"
-            },
-            "SOCKS5代理": {
-                "name": "SOCKS5代理环境",
-                "proxy_enabled": True,
-                "proxy_type": "socks5",
-                "proxy_host": "127.0.0.1",
-                "proxy_port": 1080,
-                "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                "viewport_width": 1366,
-                "viewport_height": 625,
-                "platform": "Win32",
-                "timezone": "Asia/Shanghai"
-            }
-        }
-        
         # 简单选择第一个预设
-        preset = presets["Windows Chrome"]
-        self.load_config(preset)
+        self.load_config(_PRESETS["Windows Chrome"])
 
     def generate_random(self):
         """生成随机配置"""
-        import random
-        
-        user_agents = [
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/121.0"
-        ]
-        
-        resolutions = [(1920, 1080), (1366, 768), (1440, 900)]
-        platforms = ["Win32", "MacIntel"]
-        
-        resolution = random.choice(resolutions)
+        resolution = random.choice(_RESOLUTION_POOL)
         
         config = {
             "name": f"随机环境_{random.randint(1000, 9999)}",
             "proxy_enabled": random.choice([True, False]),
-            "proxy_type": random.choice(["direct", "socks5", "http"]),
+            "proxy_type": random.choice(_PROXY_TYPE_POOL),
             "proxy_host": "127.0.0.1" if random.choice([True, False]) else "",
-            "proxy_port": random.choice([1080, 8080, 3128]),
-            "user_agent": random.choice(user_agents),
+            "proxy_port": random.choice(_PROXY_PORT_POOL),
+            "user_agent": random.choice(_UA_POOL),
             "viewport_width": resolution[0] - random.randint(0, 100),
             "viewport_height": resolution[1] - random.randint(100, 200),
-            "platform": random.choice(platforms),
+            "platform": random.choice(_PLATFORM_POOL),
             "timezone": "Asia/Shanghai"
         }
         
@@ -360,6 +413,7 @@ class BrowserEnvironmentDialog(QDialog):
 
     def load_config(self, config):
         """加载配置到表单"""
+        self._ensure_advanced_tab()
         self.name_input.setText(config.get("name", ""))
         self.proxy_enabled.setChecked(config.get("proxy_enabled", False))
         self.proxy_type.setCurrentText(config.get("proxy_type", "direct"))
@@ -381,11 +435,15 @@ class BrowserEnvironmentDialog(QDialog):
 
     def form_to_json(self):
         """表单数据转JSON"""
-        config = self.get_environment_data()
-        self.json_edit.setPlainText(json.dumps(config, ensure_ascii=False, indent=2))
+        self._ensure_json_tab()
+        text = _dumps_pretty(self.get_environment_data())
+        # 内容没变时不重设文本，省去重新排版，也保留光标和滚动位置
+        if text != self.json_edit.toPlainText():
+            self.json_edit.setPlainText(text)
 
     def json_to_form(self):
         """JSON转表单数据"""
+        self._ensure_json_tab()
         try:
             config = json.loads(self.json_edit.toPlainText())
             self.load_config(config)
@@ -394,12 +452,21 @@ class BrowserEnvironmentDialog(QDialog):
 
     def get_environment_data(self):
         """获取环境配置数据"""
+        proxy_host = self.proxy_host.text().strip()
+        if self._advanced_built:
+            webgl_vendor = self.webgl_vendor.text().strip() or None
+            webgl_renderer = self.webgl_renderer.text().strip() or None
+            latitude = self.latitude.text().strip() or None
+            longitude = self.longitude.text().strip() or None
+        else:
+            # 高级配置页从未打开过，也没有加载过配置：这些字段均未填写
+            webgl_vendor = webgl_renderer = latitude = longitude = None
         return {
             "name": self.name_input.text().strip(),
             "proxy_enabled": self.proxy_enabled.isChecked(),
             "proxy_type": self.proxy_type.currentText(),
-            "proxy_host": self.proxy_host.text().strip() or None,
-            "proxy_port": self.proxy_port.value() if self.proxy_host.text().strip() else None,
+            "proxy_host": proxy_host or None,
+            "proxy_port": self.proxy_port.value() if proxy_host else None,
             "proxy_username": self.proxy_username.text().strip() or None,
             "proxy_password": self.proxy_password.text().strip() or None,
             "user_agent": self.user_agent.text().strip(),
@@ -408,13 +475,171 @@ class BrowserEnvironmentDialog(QDialog):
             "platform": self.platform.currentText(),
             "timezone": self.timezone.currentText(),
             "locale": "zh-CN",
-            "webgl_vendor": self.webgl_vendor.text().strip() or None,
-            "webgl_renderer": self.webgl_renderer.text().strip() or None,
-            "geolocation_latitude": self.latitude.text().strip() or None,
-            "geolocation_longitude": self.longitude.text().strip() or None
+            "webgl_vendor": webgl_vendor,
+            "webgl_renderer": webgl_renderer,
+            "geolocation_latitude": latitude,
+            "geolocation_longitude": longitude
         }
 
 
+class BrowserEnvironmentTableModel(QAbstractTableModel):
+    """环境列表的数据模型：只保存 Python 列表，视图按需取数据，不再为每行创建控件"""
+
+    HEADERS = ("ID", "环境名称", "代理状态", "代理配置", "浏览器", "分辨率", "平台", "操作")
+    ACTION_COLUMN = 7
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._environments = []
+        self._rows = []
+
+    def set_environments(self, environments):
+        """替换数据；显示文本在这里一次性算好
+
+        不整体重置模型：已有的行原地更新（只重算有变化的行），多出/缺少的行
+        在末尾插入/删除，视图因此保留选中状态和滚动位置。
+        """
+        environments = list(environments)
+        old_count, new_count = len(self._environments), len(environments)
+        changed = [
+            row for row in range(min(old_count, new_count))
+            if self._environments[row] != environments[row]
+        ]
+
+        if new_count < old_count:
+            self.beginRemoveRows(QModelIndex(), new_count, old_count - 1)
+            del self._environments[new_count:]
+            del self._rows[new_count:]
+            self.endRemoveRows()
+
+        for row in changed:
+            self._environments[row] = environments[row]
+            self._rows[row] = self._display_row(environments[row])
+        if changed:
+            self.dataChanged.emit(
+                self.index(changed[0], 0), self.index(changed[-1], len(self.HEADERS) - 1)
+            )
+
+        if new_count > old_count:
+            self.beginInsertRows(QModelIndex(), old_count, new_count - 1)
+            self._environments.extend(environments[old_count:])
+            self._rows.extend(self._display_row(env) for env in environments[old_count:])
+            self.endInsertRows()
+
+    @staticmethod
+    def _display_row(env):
+        env_name = env.get('name', '')
+        if env.get('is_default'):
+            env_name = f"⭐ {env_name}"
+
+        # 真实服务的 to_dict 已带 browser_display；Mock 数据才需要现算
+        browser_info = env.get('browser_display')
+        if not browser_info:
+            ua = env.get('user_agent', '')
+            browser_info = "Chrome" if "Chrome" in ua else "Firefox" if "Firefox" in ua else "Unknown"
+
+        return (
+            str(env.get('id', '')),
+            env_name,
+            "✅ 启用" if env.get('proxy_enabled') else "❌ 直连",
+            env.get('proxy_display', '直连'),
+            browser_info,
+            env.get('resolution_display', '1920x1080'),
+            env.get('platform', ''),
+        )
+
+    def environment(self, row):
+        return self._environments[row]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        column = index.column()
+        if role == Qt.DisplayRole and column < self.ACTION_COLUMN:
+            return self._rows[index.row()][column]
+        if role == Qt.UserRole and column == self.ACTION_COLUMN:
+            # 操作列：告诉委托“设为默认”按钮是否可用
+            return bool(self._environments[index.row()].get('is_default'))
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+
+class EnvironmentActionDelegate(QStyledItemDelegate):
+    """操作列委托：直接绘制四个按钮，并按点击位置分发操作"""
+
+    action_triggered = pyqtSignal(str, int)
+
+    ACTIONS = (
+        ("default", "⭐ 默认"),
+        ("edit", "📝 编辑"),
+        ("test", "🧪 测试"),
+        ("delete", "🗑️ 删除"),
+    )
+    SPACING = 5
+    BUTTON_HEIGHT = 28
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._font = shared_font(10)
+        self._font_metrics = QFontMetrics(self._font)
+
+    def _button_rects(self, rect):
+        count = len(self.ACTIONS)
+        width = max(1, (rect.width() - self.SPACING * (count + 1)) // count)
+        height = min(self.BUTTON_HEIGHT, rect.height() - 4)
+        top = rect.top() + (rect.height() - height) // 2
+        return [
+            QRect(rect.left() + self.SPACING + i * (width + self.SPACING), top, width, height)
+            for i in range(count)
+        ]
+
+    def paint(self, painter, option, index):
+        super().paint(painter, option, index)
+
+        widget = option.widget
+        style = widget.style() if widget else QApplication.style()
+        is_default = bool(index.data(Qt.UserRole))
+
+        painter.save()
+        painter.setFont(self._font)
+        for (action, text), rect in zip(self.ACTIONS, self._button_rects(option.rect)):
+            button = QStyleOptionButton()
+            button.rect = rect
+            button.text = text
+            button.fontMetrics = self._font_metrics
+            enabled = not (action == "default" and is_default)
+            button.state = QStyle.State_Enabled | QStyle.State_Raised if enabled else QStyle.State_None
+            style.drawControl(QStyle.CE_PushButton, button, painter, widget)
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() != QEvent.MouseButtonRelease or event.button() != Qt.LeftButton:
+            return False
+
+        is_default = bool(index.data(Qt.UserRole))
+        for (action, _text), rect in zip(self.ACTIONS, self._button_rects(option.rect)):
+            if rect.contains(event.pos()):
+                if not (action == "default" and is_default):
+                    self.action_triggered.emit(action, index.row())
+                return True
+        return False
+
+
 class BrowserEnvironmentPage(QWidget):
     """浏览器环境管理页面"""
     
@@ -425,6 +650,9 @@ class BrowserEnvironmentPage(QWidget):
         
         # 初始化服务
         self.environment_service = browser_environment_service
+        # 当前用户 ID 短时缓存：刷新、设默认、添加等操作不必每次都查数据库
+        self._current_user_id = None
+        self._current_user_ts = 0.0
         
         # 显示服务状态
         if USE_REAL_SERVICES:
@@ -441,7 +669,7 @@ class BrowserEnvironmentPage(QWidget):
         layout.setSpacing(20)
         
         # 设置页面字体
-        page_font = QFont(get_ui_font_family(), 12)
+        page_font = shared_font(12)
         self.setFont(page_font)
         
         # 添加服务状态指示器
@@ -459,28 +687,33 @@ class BrowserEnvironmentPage(QWidget):
         
         # 添加刷新按钮
         refresh_btn = QPushButton("🔄 刷新数据")
-        refresh_btn.setFont(QFont(get_ui_font_family(), 12))
+        refresh_btn.setFont(shared_font(12))
         refresh_btn.clicked.connect(self.load_data)
         status_layout.addWidget(refresh_btn)
         
         layout.addLayout(status_layout)
         
         title = QLabel("🌐 浏览器环境管理")
-        title.setFont(QFont(get_ui_font_family(), 28, QFont.Bold))  # 主标题更大
+        title.setFont(shared_font(28, QFont.Bold))  # 主标题更大
         title.setAlignment(Qt.AlignCenter)
         layout.addWidget(title)
         
-        # 环境配置表格
-        self.environments_table = QTableWidget()
-        self.environments_table.setColumnCount(8)
-        self.environments_table.setHorizontalHeaderLabels([
-            "ID", "环境名称", "代理状态", "代理配置", "浏览器", "分辨率", "平台", "操作"
-        ])
+        # 环境配置表格：模型 + 视图，操作按钮由委托绘制
+        self.environments_model = BrowserEnvironmentTableModel(self)
+        self.environments_table = QTableView()
+        self.environments_table.setModel(self.environments_model)
+        self.environments_table.setSelectionBehavior(QTableView.SelectRows)
+        self.action_delegate = EnvironmentActionDelegate(self.environments_table)
+        self.environments_table.setItemDelegateForColumn(
+            BrowserEnvironmentTableModel.ACTION_COLUMN, self.action_delegate
+        )
+        # 排队连接：对话框/刷新在视图处理完鼠标事件之后再执行
+        self.action_delegate.action_triggered.connect(self._on_row_action, Qt.QueuedConnection)
         # 设置表格字体
-        table_font = QFont(get_ui_font_family(), 11)
+        table_font = shared_font(11)
         self.environments_table.setFont(table_font)
         # 设置表头字体
-        header_font = QFont(get_ui_font_family(), 12, QFont.Bold)
+        header_font = shared_font(12, QFont.Bold)
         self.environments_table.horizontalHeader().setFont(header_font)
         # 调整行高
         self.environments_table.verticalHeader().setDefaultSectionSize(35)
@@ -493,7 +726,7 @@ class BrowserEnvironmentPage(QWidget):
         self.environments_table.setColumnWidth(4, 100)  # 浏览器列
         self.environments_table.setColumnWidth(5, 100)  # 分辨率列
         self.environments_table.setColumnWidth(6, 120)  # 平台列
-        self.environments_table.setColumnWidth(7, 200)  # 操作列 - 加宽操作区域
+        self.environments_table.setColumnWidth(7, 240)  # 操作列 - 四个按钮各约 55px
         
         # 设置表格最小宽度
         self.environments_table.setMinimumWidth(1050)
@@ -504,21 +737,21 @@ class BrowserEnvironmentPage(QWidget):
         button_layout = QHBoxLayout()
         
         add_env_btn = QPushButton("➕ 添加环境")
-        add_env_btn.setFont(QFont(get_ui_font_family(), 12))
+        add_env_btn.setFont(shared_font(12))
         add_env_btn.setMinimumHeight(40)  # 增加按钮高度
         add_env_btn.setMinimumWidth(120)  # 增加按钮宽度
         add_env_btn.clicked.connect(self.add_environment)
         button_layout.addWidget(add_env_btn)
         
         preset_btn = QPushButton("📋 创建预设")
-        preset_btn.setFont(QFont(get_ui_font_family(), 12))
+        preset_btn.setFont(shared_font(12))
         preset_btn.setMinimumHeight(40)
         preset_btn.setMinimumWidth(120)
         preset_btn.clicked.connect(self.create_presets)
         button_layout.addWidget(preset_btn)
         
         test_btn = QPushButton("🧪 测试所有")
-        test_btn.setFont(QFont(get_ui_font_family(), 12))
+        test_btn.setFont(shared_font(12))
         test_btn.setMinimumHeight(40)
         test_btn.setMinimumWidth(120)
         test_btn.clicked.connect(self.test_all_environments)
@@ -531,6 +764,8 @@ class BrowserEnvironmentPage(QWidget):
         """加载环境数据"""
         try:
             print("🔄 正在刷新浏览器环境数据...")
+            # 手动刷新或切换用户后重新获取当前用户
+            self._current_user_id = None
             self.load_environments()
             print("✅ 环境数据刷新完成")
         except Exception as e:
@@ -543,85 +778,46 @@ class BrowserEnvironmentPage(QWidget):
             user_id = None
             if USE_REAL_SERVICES:
                 try:
-                    from ..services.user_service import user_service
-                    current_user = user_service.get_current_user()
-                    user_id = current_user.id if current_user else None
+                    user_id = self._get_user_id()
                 except Exception:
                     user_id = None
 
             environments = self.environment_service.get_all(user_id=user_id)
-            
-            self.environments_table.setRowCount(len(environments))
-            for row, env in enumerate(environments):
-                self.environments_table.setItem(row, 0, QTableWidgetItem(str(env.get('id', ''))))
-
-                env_name = env.get('name', '')
-                if env.get('is_default'):
-                    env_name = f"⭐ {env_name}"
-                self.environments_table.setItem(row, 1, QTableWidgetItem(env_name))
-                
-                # 代理状态
-                proxy_status = "✅ 启用" if env.get('proxy_enabled') else "❌ 直连"
-                self.environments_table.setItem(row, 2, QTableWidgetItem(proxy_status))
-                
-                # 代理配置
-                proxy_display = env.get('proxy_display', '直连')
-                self.environments_table.setItem(row, 3, QTableWidgetItem(proxy_display))
-                
-                # 浏览器信息
-                ua = env.get('user_agent', '')
-                browser_info = "Chrome" if "Chrome" in ua else "Firefox" if "Firefox" in ua else "Unknown"
-                self.environments_table.setItem(row, 4, QTableWidgetItem(browser_info))
-                
-                # 分辨率
-                resolution = env.get('resolution_display', '1920x1080')
-                self.environments_table.setItem(row, 5, QTableWidgetItem(resolution))
-                
-                # 平台
-                platform = env.get('platform', '')
-                self.environments_table.setItem(row, 6, QTableWidgetItem(platform))
-                
-                # 操作按钮
-                button_layout = QHBoxLayout()
-                button_layout.setSpacing(5)  # 减小按钮间距
-
-                default_btn = QPushButton("⭐ 默认")
-                default_btn.setFont(QFont(get_ui_font_family(), 10))
-                default_btn.setMinimumHeight(28)
-                default_btn.setMinimumWidth(50)
-                default_btn.setEnabled(not bool(env.get('is_default')))
-                default_btn.clicked.connect(lambda checked, e=env: self.set_default_environment(e))
-                button_layout.addWidget(default_btn)
-                
-                edit_btn = QPushButton("📝 编辑")  # 添加图标让按钮更美观
-                edit_btn.setFont(QFont(get_ui_font_family(), 10))
-                edit_btn.setMinimumHeight(28)
-                edit_btn.setMinimumWidth(50)  # 设置最小宽度
-                edit_btn.clicked.connect(lambda checked, e=env: self.edit_environment(e))
-                button_layout.addWidget(edit_btn)
-                
-                test_btn = QPushButton("🧪 测试")
-                test_btn.setFont(QFont(get_ui_font_family(), 10))
-                test_btn.setMinimumHeight(28)
-                test_btn.setMinimumWidth(50)
-                test_btn.clicked.connect(lambda checked, e=env: self.test_environment(e))
-                button_layout.addWidget(test_btn)
-                
-                delete_btn = QPushButton("🗑️ 删除")
-                delete_btn.setFont(QFont(get_ui_font_family(), 10))
-                delete_btn.setMinimumHeight(28)
-                delete_btn.setMinimumWidth(50)
-                delete_btn.clicked.connect(lambda checked, e=env: self.delete_environment(e))
-                button_layout.addWidget(delete_btn)
-                
-                button_widget = QWidget()
-                button_widget.setLayout(button_layout)
-                self.environments_table.setCellWidget(row, 7, button_widget)
-                
+            self.environments_model.set_environments(environments)
         except Exception as e:
             print(f"❌ 加载环境数据失败: {e}")
             QMessageBox.warning(self, "加载失败", f"加载环境数据时出错：{str(e)}")
 
+    def _get_user_id(self, max_age=5.0):
+        """获取当前用户 ID；max_age 秒内复用上一次的查询结果
+
+        当前用户可能在其它页面被切换，写操作应传 max_age=0 重新查询，
+        之后的列表刷新即可复用这次结果。
+        """
+        now = time.monotonic()
+        if self._current_user_id is not None and now - self._current_user_ts < max_age:
+            return self._current_user_id
+
+        if _user_service is None:
+            return None
+        current_user = _user_service.get_current_user()
+        self._current_user_id = current_user.id if current_user else None
+        self._current_user_ts = now
+        return self._current_user_id
+
+    def _on_row_action(self, action, row):
+        """分发操作列按钮点击"""
+        if not 0 <= row < self.environments_model.rowCount():
+            return
+        env = self.environments_model.environment(row)
+        handlers = {
+            "default": self.set_default_environment,
+            "edit": self.edit_environment,
+            "test": self.test_environment,
+            "delete": self.delete_environment,
+        }
+        handlers[action](env)
+
     def set_default_environment(self, env):
         """设置默认环境配置"""
         if not USE_REAL_SERVICES:
@@ -629,14 +825,12 @@ class BrowserEnvironmentPage(QWidget):
             return
 
         try:
-            from ..services.user_service import user_service
-
-            current_user = user_service.get_current_user()
-            if not current_user:
+            user_id = self._get_user_id(max_age=0)
+            if user_id is None:
                 QMessageBox.warning(self, "错误", "请先创建并选择一个用户作为当前用户")
                 return
 
-            self.environment_service.set_default_environment(current_user.id, env.get('id'))
+            self.environment_service.set_default_environment(user_id, env.get('id'))
             self.load_environments()
             QMessageBox.information(self, "成功", "已设置为默认环境")
         except Exception as e:
@@ -646,9 +840,8 @@ class BrowserEnvironmentPage(QWidget):
         """添加环境配置"""
         # 首先需要确保有当前用户
         if USE_REAL_SERVICES:
-            from ..services.user_service import user_service
-            current_user = user_service.get_current_user()
-            if not current_user:
+            user_id = self._get_user_id(max_age=0)
+            if user_id is None:
                 QMessageBox.warning(self, "错误", "请先创建并选择一个用户作为当前用户")
                 return
         
@@ -660,7 +853,7 @@ class BrowserEnvironmentPage(QWidget):
                     if USE_REAL_SERVICES:
                         # 使用真实服务创建环境配置
                         env = self.environment_service.create_environment(
-                            user_id=current_user.id,
+                            user_id=user_id,
                             **env_data
                         )
                         print(f"✅ 成功创建环境配置: {env.name}")
@@ -747,14 +940,13 @@ class BrowserEnvironmentPage(QWidget):
     def create_presets(self):
         """创建预设环境配置"""
         if USE_REAL_SERVICES:
-            from ..services.user_service import user_service
-            current_user = user_service.get_current_user()
-            if not current_user:
+            user_id = self._get_user_id(max_age=0)
+            if user_id is None:
                 QMessageBox.warning(self, "错误", "请先创建并选择一个用户作为当前用户")
                 return
             
             try:
-                presets = self.environment_service.create_preset_environments(current_user.id)
+                presets = self.environment_service.create_preset_environments(user_id)
                 self.load_environments()
                 QMessageBox.information(self, "成功", f"成功创建 {len(presets)} 个预设环境配置！")
             except Exception as e:
@@ -92,11 +92,11 @@ class HomePage(QWidget):
         login_controls.addWidget(self.phone_input)
 
         # 登录按钮
-        login_btn = QPushButton("🚀 登录")
-        login_btn.setObjectName("login_btn")
-        login_btn.setFixedWidth(100)
-        login_btn.clicked.connect(self.login)
-        login_controls.addWidget(login_btn)
+        self.login_btn = QPushButton("🚀 登录")
+        self.login_btn.setObjectName("login_btn")
+        self.login_btn.setFixedWidth(100)
+        self.login_btn.clicked.connect(self.login)
+        login_controls.addWidget(self.login_btn)
 
         # 一键导入系统 Chrome 登录态（用于风控/扫码登录后复用）
         self.chrome_import_btn = QPushButton("🧩 导入登录态")
@@ -557,9 +557,9 @@ class HomePage(QWidget):
         preview_layout.addWidget(self.image_title)
 
         # 添加预览发布按钮
-        preview_btn = QPushButton("🎯 预览发布")
-        preview_btn.setObjectName("preview_btn")
-        preview_btn.setStyleSheet("""
+        self.preview_btn = QPushButton("🎯 预览发布")
+        self.preview_btn.setObjectName("preview_btn")
+        self.preview_btn.setStyleSheet("""
             QPushButton {
                 padding: 8px 15px;
                 font-size: 12pt;
@@ -576,10 +576,10 @@ class HomePage(QWidget):
                 background-color: #cccccc;
             }
         """)
-        preview_btn.clicked.connect(self.preview_post)
-        preview_btn.setEnabled(False)
+        self.preview_btn.clicked.connect(self.preview_post)
+        self.preview_btn.setEnabled(False)
         preview_layout.addWidget(
-            preview_btn, alignment=Qt.AlignCenter)
+            self.preview_btn, alignment=Qt.AlignCenter)
 
         # 添加定时发布按钮
         self.schedule_btn = QPushButton("⏰ 定时发布")
@@ -1010,7 +1010,7 @@ class HomePage(QWidget):
             self.parent.update_login_button("⏳ 登录中...", False)
 
             # 添加登录任务到浏览器线程
-            self.parent.browser_thread.action_queue.append({
+            self.parent.browser_thread.enqueue_action({
                 'type': 'login',
                 'phone': phone
             })
@@ -1298,7 +1298,7 @@ class HomePage(QWidget):
             self.parent.update_preview_button("⏳ 发布中...", False)
 
             # 添加预览任务到浏览器线程
-            self.parent.browser_thread.action_queue.append({
+            self.parent.browser_thread.enqueue_action({
                 'type': 'preview',
                 'title': title,
                 'content': content,
@@ -1313,8 +1313,13 @@ class HomePage(QWidget):
         try:
             # 只允许选择“已登录”的用户（无人值守避免验证码）
             try:
+                from src.core.database_manager import database_manager
                 from src.core.services.user_service import user_service
 
+                # 数据库可能仍在后台初始化：最多等待几秒，仍未结束则提示稍后再试，避免长时间阻塞界面
+                if not database_manager.wait_ready(3):
+                    TipWindow(self.parent, "⏳ 数据库正在初始化，请稍后再试").show()
+                    return
                 current_user = user_service.get_current_user()
                 users = [u for u in user_service.list_users(active_only=True) if getattr(u, "is_logged_in", False)]
             except Exception:
@@ -1280,63 +1280,65 @@ class SimpleBackendConfigPage(QWidget):
         try:
             print("开始保存配置...")
             
-            # 保存定时发布配置
-            schedule_config = {
-                'enabled': self.schedule_enabled.isChecked(),
-                'schedule_time': self.schedule_time.dateTime().toString("yyyy-MM-dd HH:mm"),
-                'interval_hours': self.interval_hours.value(),
-                'max_posts': self.max_posts.value()
-            }
-            self.config.update_schedule_config(schedule_config)
+            # 三组配置合并为一次写入
+            with self.config.buffered():
+                # 保存定时发布配置
+                schedule_config = {
+                    'enabled': self.schedule_enabled.isChecked(),
+                    'schedule_time': self.schedule_time.dateTime().toString("yyyy-MM-dd HH:mm"),
+                    'interval_hours': self.interval_hours.value(),
+                    'max_posts': self.max_posts.value()
+                }
+                self.config.update_schedule_config(schedule_config)
             
-            # 保存模型配置（API Key 默认加密存储到 ~/.xhs_system/keys.enc）
-            provider = self.model_provider.currentText()
-            api_key_name = (getattr(self, "_api_key_name", "") or "default").strip() or "default"
-            api_key_plain = (self.api_key.text() or "").strip()
-
-            stored_in_keychain = False
-            if api_key_plain:
-                try:
-                    stored_in_keychain = bool(api_key_manager.add_key(provider, api_key_name, api_key_plain))
-                except Exception:
-                    stored_in_keychain = False
+                # 保存模型配置（API Key 默认加密存储到 ~/.xhs_system/keys.enc）
+                provider = self.model_provider.currentText()
+                api_key_name = (getattr(self, "_api_key_name", "") or "default").strip() or "default"
+                api_key_plain = (self.api_key.text() or "").strip()
 
-            if stored_in_keychain:
-                api_key_to_save = ""
-            else:
-                # 用户手动输入但存储失败，则保底写入 settings.json，保证可用
-                api_key_to_save = api_key_plain
-
-            if not api_key_plain and getattr(self, "_api_key_placeholder_active", False):
-                # 留空表示保持加密存储中的 key，不改动
-                api_key_to_save = ""
-
-            model_config = {
-                'provider': provider,
-                'api_key': api_key_to_save,
-                'api_key_name': api_key_name,
-                'api_endpoint': self.api_endpoint.text(),
-                'model_name': self.model_name.text(),
-                'prompt_template': self.prompt_template.currentData(),
-                'system_prompt': self.system_prompt.toPlainText(),
-                'advanced': {
-                    'temperature': 0.7,
-                    'max_tokens': 1000,
-                    'timeout': 30
+                stored_in_keychain = False
+                if api_key_plain:
+                    try:
+                        stored_in_keychain = bool(api_key_manager.add_key(provider, api_key_name, api_key_plain))
+                    except Exception:
+                        stored_in_keychain = False
+
+                if stored_in_keychain:
+                    api_key_to_save = ""
+                else:
+                    # 用户手动输入但存储失败，则保底写入 settings.json，保证可用
+                    api_key_to_save = api_key_plain
+
+                if not api_key_plain and getattr(self, "_api_key_placeholder_active", False):
+                    # 留空表示保持加密存储中的 key，不改动
+                    api_key_to_save = ""
+
+                model_config = {
+                    'provider': provider,
+                    'api_key': api_key_to_save,
+                    'api_key_name': api_key_name,
+                    'api_endpoint': self.api_endpoint.text(),
+                    'model_name': self.model_name.text(),
+                    'prompt_template': self.prompt_template.currentData(),
+                    'system_prompt': self.system_prompt.toPlainText(),
+                    'advanced': {
+                        'temperature': 0.7,
+                        'max_tokens': 1000,
+                        'timeout': 30
+                    }
                 }
-            }
-            self.config.update_model_config(model_config)
+                self.config.update_model_config(model_config)
             
-            # 保存API配置
-            api_config = {
-                'xhs_api_key': self.xhs_api_key.text(),
-                'xhs_api_secret': self.xhs_api_secret.text(),
-                'image_provider': self.image_provider.currentText(),
-                'image_endpoint': self.image_endpoint.text(),
-                'image_access_key': '',
-                'image_secret_key': ''
-            }
-            self.config.update_api_config(api_config)
+                # 保存API配置
+                api_config = {
+                    'xhs_api_key': self.xhs_api_key.text(),
+                    'xhs_api_secret': self.xhs_api_secret.text(),
+                    'image_provider': self.image_provider.currentText(),
+                    'image_endpoint': self.image_endpoint.text(),
+                    'image_access_key': '',
+                    'image_secret_key': ''
+                }
+                self.config.update_api_config(api_config)
             
             print("配置保存完成")
             QMessageBox.information(self, "成功", "配置已保存！")
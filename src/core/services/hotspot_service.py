@@ -13,7 +13,7 @@ import json
 import os
 import time
 from pathlib import Path
-from typing import Dict, List, Optional, Sequence, Tuple
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
 from urllib.parse import quote
 
 import requests
@@ -159,17 +159,23 @@ class HotspotService:
 
     def fetch_baidu_search_snippets(self, query: str, limit: int = 3, timeout: int = 10) -> List[Dict[str, str]]:
         """使用百度移动搜索页抓取“热点内容摘要”（用于跨平台补全上下文）。"""
+        return list(self.iter_baidu_search_snippets(query, limit=limit, timeout=timeout))
+
+    def iter_baidu_search_snippets(self, query: str, limit: int = 3, timeout: int = 10) -> Iterator[Dict[str, str]]:
+        """流式读取百度移动搜索页，边下载边解析，逐条产出摘要。
+
+        解析到 limit 条后立即断开连接，不再下载页面剩余部分。
+        """
 
         query = (query or "").strip()
         if not query:
-            return []
+            return
 
         url = f"https://m.baidu.com/s?word={quote(query)}"
         headers = {"User-Agent": "Mozilla/5.0"}
         try:
-            resp = requests.get(url, timeout=timeout, headers=headers)
+            resp = requests.get(url, timeout=timeout, headers=headers, stream=True)
             resp.raise_for_status()
-            html = resp.text or ""
         except Exception as e:
             raise HotspotServiceError(f"获取百度搜索摘要失败: {e}")
 
@@ -187,8 +193,11 @@ class HotspotService:
                 self.current: Dict[str, str] = {}
                 self.text_nodes: List[str] = []
                 self.items: List[Dict[str, str]] = []
+                # 分块 feed 时同一段文本可能被拆成多次 handle_data，需要拼回一段
+                self.last_was_data = False
 
             def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]):
+                self.last_was_data = False
                 attr = dict(attrs)
 
                 if self.in_result and tag in {"script", "style", "noscript"}:
@@ -224,6 +233,7 @@ class HotspotService:
                             self.current["url"] = href
 
             def handle_endtag(self, tag: str):
+                self.last_was_data = False
                 if not self.in_result:
                     return
 
@@ -310,23 +320,51 @@ class HotspotService:
                     return
                 if self.skip_depth > 0:
                     return
-                t = (data or "").strip()
-                if not t:
-                    return
-                self.text_nodes.append(t)
+                # 保留原始文本，finalize 时统一清洗
+                if self.last_was_data and self.text_nodes:
+                    self.text_nodes[-1] += data or ""
+                else:
+                    self.text_nodes.append(data or "")
+                self.last_was_data = True
 
-        parser = _Parser(want=limit)
-        try:
-            parser.feed(html)
-        except _Stop:
-            pass
-        except Exception:
-            # ignore parsing errors; return best-effort
-            pass
+            def _break_data(self, *args):
+                # 注释/声明/处理指令同样分隔文本块，只有 feed 分块处被拆开的文本才需要拼接
+                self.last_was_data = False
+
+            handle_comment = handle_decl = handle_pi = unknown_decl = _break_data
 
-        # 过滤掉明显无效项（无链接且无摘要的）
-        items = [x for x in parser.items if x.get("title")]
-        return items[: max(1, int(limit))]
+        parser = _Parser(want=limit)
+        want = parser.want
+        emitted = 0
+        with resp:
+            # 未声明编码时按 utf-8 解码，保证 iter_content 产出的是文本
+            resp.encoding = resp.encoding or "utf-8"
+            chunks = resp.iter_content(chunk_size=16 * 1024, decode_unicode=True)
+            while emitted < want:
+                try:
+                    chunk = next(chunks)
+                except StopIteration:
+                    break
+                except Exception as e:
+                    if emitted:
+                        break
+                    raise HotspotServiceError(f"获取百度搜索摘要失败: {e}")
+
+                finished = False
+                try:
+                    parser.feed(chunk)
+                except _Stop:
+                    finished = True
+                except Exception:
+                    # ignore parsing errors; return best-effort
+                    finished = True
+
+                # 只产出有标题的项（解析器已过滤无标题结果）
+                while emitted < min(len(parser.items), want):
+                    yield parser.items[emitted]
+                    emitted += 1
+                if finished:
+                    break
 
     def load_cache(self) -> Dict[str, dict]:
         try:
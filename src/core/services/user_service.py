@@ -7,7 +7,7 @@ from __future__ import annotations
 
 from datetime import datetime
 import sys
-from typing import List, Optional
+from typing import List, Optional, Set
 
 from sqlalchemy import and_, or_
 
@@ -52,6 +52,15 @@ class UserService:
         finally:
             session.close()
 
+    def list_usernames_with_prefix(self, prefix: str) -> Set[str]:
+        """一次查询返回所有以 prefix 开头的用户名（用于生成不重复的用户名）。"""
+        session = self.db_manager.get_session_direct()
+        try:
+            rows = session.query(User.username).filter(User.username.startswith(prefix, autoescape=True)).all()
+            return {row[0] for row in rows}
+        finally:
+            session.close()
+
     def get_current_user(self) -> Optional[User]:
         """获取当前用户；如果没有当前用户则自动选一个（或创建默认用户）。"""
         session = self.db_manager.get_session_direct()
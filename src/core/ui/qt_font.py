@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import sys
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from PyQt5.QtGui import QFont, QFontDatabase
 from PyQt5.QtWidgets import QApplication
@@ -9,6 +9,8 @@ from PyQt5.QtWidgets import QApplication
 _cached_ui_font_family: Optional[str] = None
 _cached_emoji_font_family: Optional[str] = None
 _cached_mono_font_family: Optional[str] = None
+_cached_ui_text_font_family_css: Optional[str] = None
+_shared_fonts: Dict[Tuple[bool, int, int], QFont] = {}
 
 
 def _candidates() -> list[str]:
@@ -146,7 +148,15 @@ def get_ui_font_family_css() -> str:
 
 def get_ui_text_font_family_css() -> str:
     """Best-effort font-family list for normal UI text (CJK + emoji)."""
-    return f"{get_ui_font_family_css()}, {get_emoji_font_family_css()}"
+    global _cached_ui_text_font_family_css
+    if _cached_ui_text_font_family_css:
+        return _cached_ui_text_font_family_css
+
+    css = f"{get_ui_font_family_css()}, {get_emoji_font_family_css()}"
+    # Avoid caching before QApplication is created.
+    if QApplication.instance() is not None:
+        _cached_ui_text_font_family_css = css
+    return css
 
 
 def get_mono_font_family_css() -> str:
@@ -156,3 +166,18 @@ def get_mono_font_family_css() -> str:
 def ui_font(point_size: int = 12, weight: int = -1, italic: bool = False) -> QFont:
     """Convenience helper for a consistent UI font."""
     return QFont(get_ui_font_family(), point_size, weight, italic)
+
+
+def shared_font(point_size: int = 12, weight: int = -1, *, mono: bool = False) -> QFont:
+    """Return a cached UI (or monospace) font; setFont copies it, so sharing is safe."""
+    key = (mono, point_size, weight)
+    font = _shared_fonts.get(key)
+    if font is not None:
+        return font
+
+    family = get_mono_font_family() if mono else get_ui_font_family()
+    font = QFont(family, point_size, weight)
+    # Avoid caching before QApplication is created.
+    if QApplication.instance() is not None:
+        _shared_fonts[key] = font
+    return font
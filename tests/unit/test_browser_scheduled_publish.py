@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+定时发布临时浏览器测试
+使用假的 XiaohongshuPoster，不启动真实浏览器
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../.."))
+
+pytest.importorskip("PyQt5")
+pytest.importorskip("playwright")
+
+from src.core import browser as browser_module
+from src.core.browser import BrowserThread
+
+
+class _FakePoster:
+    instances = []
+
+    def __init__(self, user_id=None, browser_environment=None):
+        self.user_id = user_id
+        self.closed = False
+        self.fail_post = False
+        _FakePoster.instances.append(self)
+
+    async def initialize(self):
+        # 模拟较慢的浏览器启动，超过回收间隔
+        await asyncio.sleep(0.05)
+
+    async def post_article(self, title, content, images, auto_publish=False):
+        assert not self.closed, "发布过程中浏览器被关闭"
+        await asyncio.sleep(0.05)
+        if self.fail_post:
+            raise RuntimeError("publish failed")
+
+    async def close(self, force=False):
+        self.closed = True
+
+
+def _jobs(n=2):
+    return [
+        {"task_id": f"t{i}", "user_id": 1, "browser_env": None, "title": "标题", "content": "正文", "images": []}
+        for i in range(n)
+    ]
+
+
+@pytest.fixture
+def thread(monkeypatch):
+    _FakePoster.instances = []
+    monkeypatch.setattr(browser_module, "XiaohongshuPoster", _FakePoster)
+    t = BrowserThread()
+    t.EPHEMERAL_IDLE_SECONDS = 0.01
+    t.EPHEMERAL_REAP_INTERVAL = 0.01
+    results = []
+    t.scheduled_task_result.connect(lambda task_id, ok, err: results.append((task_id, ok)))
+    t.results = results
+    return t
+
+
+class TestScheduledPublishEphemeralBrowser:
+    def test_reaper_does_not_close_poster_during_batch(self, thread):
+        async def run():
+            reaper = asyncio.ensure_future(thread._ephemeral_reaper())
+            try:
+                await thread._publish_jobs(1, _jobs())
+                poster = thread._ephemeral_poster
+                assert poster is not None and not poster.closed
+                # 批次结束后空闲超时，才会被回收
+                await asyncio.sleep(0.1)
+                assert poster.closed
+                assert thread._ephemeral_poster is None
+            finally:
+                reaper.cancel()
+
+        asyncio.run(run())
+        assert thread.results == [("t0", True), ("t1", True)]
+
+    def test_poster_closed_after_publish_error(self, thread):
+        async def run():
+            await thread._publish_jobs(1, _jobs(1))
+            poster = thread._ephemeral_poster
+            poster.fail_post = True
+            await thread._publish_jobs(1, _jobs(1))
+            assert poster.closed
+            assert thread._ephemeral_poster is None
+            assert thread._ephemeral_in_use == 0
+
+        asyncio.run(run())
+        assert thread.results == [("t0", True), ("t0", False)]
+
+
+class TestFilterExistingImages:
+    def test_keeps_paths_whose_case_differs_from_listing(self, tmp_path, monkeypatch):
+        for name in ("a.jpg", "b.jpg"):
+            (tmp_path / name).write_bytes(b"x")
+        real_isfile = os.path.isfile
+
+        def case_insensitive_isfile(path):
+            # 模拟 macOS/Windows 上大小写不敏感的文件系统
+            head, tail = os.path.split(path)
+            return real_isfile(os.path.join(head, tail.lower()))
+
+        monkeypatch.setattr(browser_module.os.path, "isfile", case_insensitive_isfile)
+        images = [str(tmp_path / "a.jpg"), str(tmp_path / "B.JPG"), str(tmp_path / "missing.jpg")]
+
+        assert BrowserThread._filter_existing_images(images) == images[:2]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+配置管理测试
+测试 settings.json 的加载、默认项补齐与写入
+"""
+
+import json
+import os
+import sys
+
+import pytest
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../.."))
+
+from src.config.config import Config
+
+
+@pytest.fixture
+def config_home(tmp_path, monkeypatch):
+    """把配置文件指向临时目录，避免读写真实配置"""
+    config_file = tmp_path / ".xhs_system" / "settings.json"
+    config_file.parent.mkdir()
+    monkeypatch.setattr("src.config.config._CONFIG_PATH", str(config_file))
+    return config_file
+
+
+def _count_saves(monkeypatch):
+    calls = []
+    original = Config._save_now
+
+    def counting_save(self):
+        calls.append(1)
+        original(self)
+
+    # Config 使用 __slots__，只能在类上替换方法
+    monkeypatch.setattr(Config, "_save_now", counting_save)
+    return calls
+
+
+class TestConfig:
+    def test_creates_default_file(self, config_home):
+        cfg = Config()
+        # 配置在首次访问时才加载
+        assert not config_home.exists()
+
+        assert cfg.get_phone_config() == "18888888888"
+        assert config_home.exists()
+        assert json.loads(config_home.read_text(encoding="utf-8"))["app"] == "debug"
+
+    def test_fills_missing_defaults(self, config_home):
+        config_home.write_text(json.dumps({"phone": "13900000000", "title_edit": {"title": "T"}}), encoding="utf-8")
+
+        cfg = Config()
+
+        assert cfg.get_phone_config() == "13900000000"
+        assert cfg.get_title_config() == {"title": "T", "author": "小红书"}
+        saved = json.loads(config_home.read_text(encoding="utf-8"))
+        assert saved["app"] == "debug"
+
+    def test_corrupt_file_is_not_overwritten(self, config_home):
+        config_home.write_text("{broken", encoding="utf-8")
+
+        cfg = Config()
+
+        assert cfg.get_phone_config() == "18888888888"
+        assert config_home.read_text(encoding="utf-8") == "{broken"
+
+        # 修改配置同样不能把默认配置写回原文件
+        cfg.update_author_config("新作者")
+        assert cfg.get_title_config()["author"] == "新作者"
+        assert config_home.read_text(encoding="utf-8") == "{broken"
+
+    def test_buffered_coalesces_writes(self, config_home, monkeypatch):
+        cfg = Config()
+        cfg.get_app_config()
+        calls = _count_saves(monkeypatch)
+
+        with cfg.buffered():
+            cfg.update_phone_config("13800000000")
+            cfg.update_title_config("新标题")
+            cfg.update_author_config("新作者")
+            assert calls == []
+
+        assert len(calls) == 1
+        saved = json.loads(config_home.read_text(encoding="utf-8"))
+        assert saved["phone"] == "13800000000"
+        assert saved["title_edit"] == {"author": "新作者", "title": "新标题"}
+
+    def test_instances_share_loaded_config(self, config_home, monkeypatch):
+        first = Config()
+        first.update_phone_config("13700000000")
+
+        # 文件未被外部修改时不再重新解析
+        monkeypatch.setattr("src.config.config._loads", lambda text: pytest.fail("unexpected re-read"))
+        second = Config()
+
+        assert second.get_phone_config() == "13700000000"
+
+    def test_reloads_after_external_change(self, config_home):
+        Config().get_app_config()
+        data = json.loads(config_home.read_text(encoding="utf-8"))
+        data["phone"] = "13600000000"
+        config_home.write_text(json.dumps(data, ensure_ascii=False) + "\n", encoding="utf-8")
+
+        assert Config().get_phone_config() == "13600000000"
+
+    def test_cached_getters_see_updates_from_other_instances(self, config_home):
+        first = Config()
+        second = Config()
+        assert second.get_phone_config() == "18888888888"
+
+        first.update_phone_config("13400000000")
+
+        assert second.get_phone_config() == "13400000000"
+
+    def test_empty_section_is_not_replaced_by_defaults(self, config_home):
+        cfg = Config()
+        cfg.update_templates_config({})
+
+        assert cfg.get_templates_config() == {}
+        assert Config().get_templates_config() == {}
+        assert json.loads(config_home.read_text(encoding="utf-8"))["templates"] == {}
+
+    def test_update_with_same_value_skips_save(self, config_home, monkeypatch):
+        cfg = Config()
+        cfg.update_phone_config("13300000000")
+        cfg.update_schedule_config({"enabled": True, "tasks": []})
+        calls = _count_saves(monkeypatch)
+
+        cfg.update_phone_config("13300000000")
+        cfg.update_schedule_config({"enabled": True, "tasks": []})
+        assert calls == []
+
+        # 原地修改后传回同一个 dict 仍然会保存
+        schedule = cfg.get_schedule_config()
+        schedule["enabled"] = False
+        cfg.update_schedule_config(schedule)
+        assert len(calls) == 1
+        assert json.loads(config_home.read_text(encoding="utf-8"))["schedule"]["enabled"] is False
+
+    def test_skips_write_when_unchanged(self, config_home, monkeypatch):
+        cfg = Config()
+        cfg.update_phone_config("13500000000")
+
+        monkeypatch.setattr("src.config.config.os.replace", lambda src, dst: pytest.fail("unexpected write"))
+        cfg.update_phone_config("13500000000")
+
+        assert not os.path.exists(str(config_home) + ".tmp")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -199,6 +199,27 @@ class TestDatabase:
         
         session.close()
     
+    def test_list_usernames_with_prefix(self, temp_db):
+        """测试按前缀一次查询用户名"""
+        engine, db_path = temp_db
+        Session = sessionmaker(bind=engine)
+        session = Session()
+        session.add_all([
+            User(username='user_138', phone='138'),
+            User(username='user_138_1', phone='138-1'),
+            User(username='userX138', phone='139'),
+        ])
+        session.commit()
+        session.close()
+
+        from src.core.services.user_service import UserService
+
+        service = UserService()
+        service.db_manager = type('FakeDBManager', (), {'get_session_direct': staticmethod(Session)})()
+
+        # 前缀中的 "_" 按字面匹配，不作为 LIKE 通配符
+        assert service.list_usernames_with_prefix('user_138') == {'user_138', 'user_138_1'}
+
     def test_database_manager_integration(self):
         """测试数据库管理器集成"""
         # 创建临时目录
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+热点服务测试
+测试百度搜索摘要的流式解析（不发起网络请求）
+"""
+
+import os
+import sys
+
+import pytest
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../.."))
+
+from src.core.services import hotspot_service as hotspot_module
+from src.core.services.hotspot_service import HotspotService
+
+
+class _FakeResponse:
+    encoding = "utf-8"
+
+    def __init__(self, chunks):
+        self._chunks = chunks
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size=None, decode_unicode=False):
+        return iter(self._chunks)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+def _snippets(monkeypatch, chunks):
+    monkeypatch.setattr(hotspot_module.requests, "get", lambda *a, **kw: _FakeResponse(chunks))
+    return HotspotService().fetch_baidu_search_snippets("热点", limit=1)
+
+
+class TestBaiduSnippets:
+    def test_text_split_across_chunks_is_joined(self, monkeypatch):
+        html = '<div class="c-result result"><span>这是第一条结果标题</span><p>摘要内容</p></div>'
+        cut = html.index("结果")
+
+        items = _snippets(monkeypatch, [html[:cut], html[cut:]])
+
+        assert items[0]["title"] == "这是第一条结果标题"
+        assert items[0]["snippet"] == "摘要内容"
+
+    def test_comment_separates_text_blocks(self, monkeypatch):
+        html = '<div class="c-result result">这是结果标题<!-- ad -->这是另一段摘要</div>'
+
+        items = _snippets(monkeypatch, [html])
+
+        assert items[0]["title"] == "这是结果标题"
+        assert items[0]["snippet"] == "这是另一段摘要"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
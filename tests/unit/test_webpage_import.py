@@ -8,11 +8,19 @@ import os
 import sys
 
 import pytest
+import requests
 
 # 添加项目根目录到路径
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../.."))
 
-from src.core.importers.webpage_article import parse_webpage_html
+from src.core.importers.webpage_article import _decode_body, parse_webpage_html
+
+
+def _response(body: bytes, encoding=None) -> requests.Response:
+    resp = requests.Response()
+    resp._content = body
+    resp.encoding = encoding
+    return resp
 
 
 class TestWebpageImport:
@@ -71,6 +79,16 @@ class TestWebpageImport:
         assert parsed["cover_image_url"] == "https://cdn.example.com/assets/img/a.png"
         assert parsed["image_urls"] == []
 
+    def test_decode_body_without_charset(self, monkeypatch):
+        # 无 charset 时依次尝试 utf-8 / gb18030，不触发整页编码探测
+        monkeypatch.setattr(
+            requests.Response, "apparent_encoding", property(lambda self: pytest.fail("unexpected detection"))
+        )
+
+        assert _decode_body(_response("正文".encode("utf-8"))) == "正文"
+        assert _decode_body(_response("正文".encode("gbk"))) == "正文"
+        assert _decode_body(_response("正文".encode("gbk"), encoding="gbk")) == "正文"
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+公众号文章导入解析测试
+仅测试 HTML 解析逻辑（不发起网络请求）
+"""
+
+import os
+import sys
+
+import pytest
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../.."))
+
+from src.core.importers.wechat_article import _StopParsing, _WechatContentParser
+
+
+def _parse_content(html: str) -> _WechatContentParser:
+    parser = _WechatContentParser()
+    try:
+        parser.feed(html)
+    except _StopParsing:
+        pass
+    return parser
+
+
+class TestWechatImport:
+    def test_content_stops_at_js_content_end_despite_void_tags(self):
+        html = """
+        <div id="js_content">
+          <p>第一段<br>正文<img data-src="https://mmbiz.qpic.cn/a.jpg"></p>
+          <section><p>第二段正文</section>
+        </div>
+        <div class="footer">页脚内容<img src="https://mmbiz.qpic.cn/footer.jpg"></div>
+        """
+
+        parser = _parse_content(html)
+        text = "".join(parser.text_parts)
+
+        assert "第一段" in text and "第二段正文" in text
+        assert "页脚内容" not in text
+        assert parser.image_urls == ["https://mmbiz.qpic.cn/a.jpg"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])